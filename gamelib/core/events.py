@@ -52,20 +52,30 @@ Doing update, dt=0.01
 #   handler marking more uniform, but may conflict with using dataclasses and
 #   named tuples for events.
 
+import types
+import weakref
 import threading
 import collections
-import multiprocessing
 
 from typing import Sequence
 from typing import NamedTuple
+from typing import TYPE_CHECKING
 
 from gamelib import utils
 
+if TYPE_CHECKING:
+    import multiprocessing.connection
+
 
 _HANDLER_INJECTION_ATTRIBUTE = "_gamelib_handler_"
-_event_handlers = collections.defaultdict(list)
+# event type -> tuple of handlers, rebuilt whenever handlers are added or
+# removed so that publishing only has to iterate a tuple
+_event_handlers = dict()
 _internal_handlers = list()
 _adapters = dict()
+# class -> its marked handler names, see _marked_handler_names. Held weakly
+# so classes (including dynamically created ones) can still be collected
+_handler_names_by_class = weakref.WeakKeyDictionary()
 
 
 class Update(NamedTuple):
@@ -89,15 +99,39 @@ def publish(event):
         An event is just a data container.
     """
 
-    if isinstance(event, InternalUpdate):
-        for handler_ in _internal_handlers:
-            handler_(event)
+    event_type = type(event)
+    if event_type is InternalUpdate:
+        handlers = _internal_handlers
+    else:
+        handlers = _event_handlers.get(event_type)
+    if not handlers:
         return
-
-    for handler_ in _event_handlers[type(event)]:
+    for handler_ in handlers:
         handler_(event)
 
 
+def publish_many(events_):
+    """Publish a sequence of events in order. Handlers are looked up once for
+    each run of consecutive events sharing a type, rather than per event.
+
+    Parameters
+    ----------
+    events_ : Iterable[Any]
+    """
+
+    event_type = None
+    handlers = ()
+    for event in events_:
+        if type(event) is not event_type:
+            event_type = type(event)
+            if event_type is InternalUpdate:
+                handlers = _internal_handlers
+            else:
+                handlers = _event_handlers.get(event_type, ())
+        for handler_ in handlers:
+            handler_(event)
+
+
 def subscribe(event_type, *callbacks):
     """Subscribe callbacks to a given event type.
 
@@ -110,7 +144,9 @@ def subscribe(event_type, *callbacks):
     if event_type == InternalUpdate:
         _internal_handlers.extend(callbacks)
     else:
-        _event_handlers[event_type].extend(callbacks)
+        _event_handlers[event_type] = (
+            _event_handlers.get(event_type, ()) + callbacks
+        )
 
 
 def unsubscribe(event_type, *callbacks) -> None:
@@ -130,11 +166,16 @@ def unsubscribe(event_type, *callbacks) -> None:
                 pass
         return
 
+    handlers = list(_event_handlers.get(event_type, ()))
     for callback in callbacks:
         try:
-            _event_handlers[event_type].remove(callback)
+            handlers.remove(callback)
         except ValueError:
             pass
+    if handlers:
+        _event_handlers[event_type] = tuple(handlers)
+    else:
+        _event_handlers.pop(event_type, None)
 
 
 def subscribe_marked(obj):
@@ -179,7 +220,7 @@ def clear_handlers(*event_types):
         _adapters.clear()
     else:
         for type_ in event_types:
-            _event_handlers[type_].clear()
+            _event_handlers.pop(type_, None)
 
 
 def handler(event_type):
@@ -216,11 +257,30 @@ def find_marked_handlers(obj):
     """
 
     handlers = collections.defaultdict(list)
-    for mark, method in utils.MethodMarker.lookup(obj, type="event").items():
-        handlers[mark.extra].append(method)
+    for event_type, names in _marked_handler_names(type(obj)).items():
+        handlers[event_type].extend(getattr(obj, name) for name in names)
     return handlers
 
 
+def _marked_handler_names(cls):
+    """The names of marked handler methods grouped by event type. Markers are
+    fixed once a class is created, so this only needs computing once per
+    class rather than for every object subscribed."""
+
+    cached = _handler_names_by_class.get(cls)
+    if cached is not None:
+        return cached
+    names = collections.defaultdict(list)
+    markers = getattr(cls, utils.MethodMarker._INJECTION_ATTRIBUTE, ())
+    for mark in markers:
+        if mark.type == "event":
+            names[mark.extra].append(mark.name)
+    cached = _handler_names_by_class[cls] = types.MappingProxyType(
+        {event_type: tuple(names) for event_type, names in names.items()}
+    )
+    return cached
+
+
 def service_connection(conn, *event_types, poll=True):
     """Send the specified event_types over the given connection when they
     are posted. If `poll` is True (the default) then this will also poll the
@@ -257,48 +317,75 @@ def stop_connection_service(conn):
     adapter.stop()
 
 
+def _connection():
+    """multiprocessing is only needed once a connection is serviced, so it
+    is imported on demand rather than slowing down importing gamelib."""
+
+    import multiprocessing.connection
+
+    return multiprocessing.connection
+
+
 class _ConnectionAdapter:
     """Internal helper for serving and receiving from a multiprocessing.Pipe"""
 
     def __init__(
         self,
-        conn: multiprocessing.Pipe,
+        conn: "multiprocessing.connection.Connection",
         event_types: Sequence[type],
     ):
         self.conn = conn
         self.event_types = event_types
         self.thread = threading.Thread(target=self._poll, daemon=True)
         self._running = False
+        self._wakeup_recv = None
+        self._wakeup_send = None
 
     def _poll(self):
-        """Mainloop for a polling thread."""
+        """Mainloop for a polling thread. Sleeps until something arrives on
+        the pipe (or the adapter is stopped) instead of polling on a timer."""
 
-        self._running = True
-        while self._running:
-            try:
-                if not self.conn.poll(0.01):
-                    continue
-                message = self.conn.recv()
-                event = message
-                publish(event)
-            except (BrokenPipeError, EOFError):
-                self._running = False
-                break
-            except TypeError as e:
-                if isinstance(message, Exception):
-                    raise message
-                else:
-                    raise e
+        waitables = [self.conn, self._wakeup_recv]
+        message = None
+        try:
+            while self._running:
+                try:
+                    _connection().wait(waitables)
+                    # drain everything that's already waiting before sleeping
+                    while self._running and self.conn.poll():
+                        message = self.conn.recv()
+                        event = message
+                        publish(event)
+                except (BrokenPipeError, EOFError):
+                    self._running = False
+                    break
+                except TypeError as e:
+                    if isinstance(message, Exception):
+                        raise message
+                    else:
+                        raise e
+        finally:
+            self._wakeup_recv.close()
+            self._wakeup_send.close()
 
     def start(self):
         """Start the thread"""
 
+        # lets stop() wake the thread while it's blocked waiting on conn
+        self._wakeup_recv, self._wakeup_send = _connection().Pipe(False)
+        self._running = True
         self.thread.start()
 
     def stop(self):
         """Stop the thread"""
 
         self._running = False
+        if self._wakeup_send is None or self._wakeup_send.closed:
+            return
+        try:
+            self._wakeup_send.send(None)
+        except OSError:
+            pass  # the thread has already finished and closed the pipe
 
     def __call__(self, event):
         """Handles event by passing through the pipe."""
@@ -67,6 +67,8 @@ based off of keystroke.
 import collections
 import dataclasses
 import enum
+import functools
+import inspect
 from typing import NamedTuple
 from typing import Callable
 from typing import Iterable
@@ -239,7 +241,10 @@ class InputSchema:
                 Modifier.ALT in mods,
             )
             self._callback_tree.register(
-                callback, input_type, modifiers=mods, action=action
+                _event_callback(callback),
+                input_type,
+                modifiers=mods,
+                action=action,
             )
 
     def __call__(self, event):
@@ -252,15 +257,7 @@ class InputSchema:
         callback = self._callback_tree.get_callback(event)
         if not callback:
             return
-
-        try:
-            callback(event)
-        except TypeError as e:
-            if "positional argument" in e.args[0]:
-                # callback without passing event as an argument
-                callback()
-            else:
-                raise e
+        callback(event)
 
 
 class _StringMappingEnum(enum.Enum):
@@ -269,9 +266,7 @@ class _StringMappingEnum(enum.Enum):
 
     @classmethod
     def map_string(cls, string):
-        for member in cls:
-            if string.lower() in member.value:
-                return member
+        return _string_lookup(cls).get(string.lower())
 
     def __repr__(self):
         return f"<{self.__class__.__name__}.{self.name}>"
@@ -288,6 +283,18 @@ class _StringMappingEnum(enum.Enum):
         return hash(self.name)
 
 
+@functools.lru_cache(maxsize=None)
+def _string_lookup(enum_cls):
+    """Maps each string value of a _StringMappingEnum to its member, built
+    once per enum rather than scanning every member for each string."""
+
+    lookup = dict()
+    for member in enum_cls:
+        for string in member.value:
+            lookup.setdefault(string, member)
+    return lookup
+
+
 class Keyboard(_StringMappingEnum):
     """Defines which string values map to which keyboard inputs."""
 
@@ -638,50 +645,44 @@ class MouseScroll(_InputEvent):
 
 
 class _InputHandlerLookup:
-    """Internal class that organizes the handlers for an InputSchema. Some
-    events have nested lookups since their lookup depends on Action,
-    Modifiers or both. May want to consider hashing the nested lookups in
-    the future."""
+    """Internal class that organizes the handlers for an InputSchema.
+    Callbacks are kept in a single dict keyed by (event type, input enum,
+    modifiers), with None standing in for whatever an event type lacks, so
+    finding the callback for an event is one lookup."""
 
     def __init__(self):
-        self._lookup = {
-            KeyDown: collections.defaultdict(dict),
-            KeyUp: collections.defaultdict(dict),
-            KeyIsPressed: collections.defaultdict(dict),
-            MouseDown: dict(),
-            MouseUp: dict(),
-            MouseIsPressed: dict(),
-            MouseDrag: None,
-            MouseScroll: None,
-            MouseMotion: None,
-        }
+        self._lookup = dict()
 
     def register(
         self, callback, input_enum, modifiers=Modifiers(), action=Action.PRESS
     ):
+        key = None
         if input_enum in Keyboard:
             if action == Action.PRESS:
-                self._lookup[KeyDown][input_enum][modifiers] = callback
+                key = (KeyDown, input_enum, modifiers)
             elif action == Action.RELEASE:
-                self._lookup[KeyUp][input_enum][modifiers] = callback
+                key = (KeyUp, input_enum, modifiers)
             elif action == Action.IS_PRESSED:
-                self._lookup[KeyIsPressed][input_enum][modifiers] = callback
+                key = (KeyIsPressed, input_enum, modifiers)
 
         elif input_enum in MouseButton:
             if action == Action.PRESS:
-                self._lookup[MouseDown][input_enum] = callback
+                key = (MouseDown, input_enum, None)
             elif action == Action.RELEASE:
-                self._lookup[MouseUp][input_enum] = callback
+                key = (MouseUp, input_enum, None)
             elif action == Action.IS_PRESSED:
-                self._lookup[MouseIsPressed][input_enum] = callback
+                key = (MouseIsPressed, input_enum, None)
 
         else:
             if input_enum == Mouse.MOTION:
-                self._lookup[MouseMotion] = callback
+                key = (MouseMotion, None, None)
             elif input_enum == Mouse.DRAG:
-                self._lookup[MouseDrag] = callback
+                key = (MouseDrag, None, None)
             elif input_enum == Mouse.SCROLL:
-                self._lookup[MouseScroll] = callback
+                key = (MouseScroll, None, None)
+
+        if key is not None:
+            self._lookup[key] = callback
 
     def get_callback(self, event):
         """Try to get registered callback for this event.
@@ -692,25 +693,22 @@ class _InputHandlerLookup:
             depending on if a handler has been registered for this event.
         """
 
-        event_type = type(event)
-        if not self._lookup.get(event_type):
-            return
-
         enum_ = getattr(event, "key", None) or getattr(event, "button", None)
-        if enum_:
-            modifiers = getattr(event, "modifiers", None)
-            if modifiers is not None:
-                return self._lookup[event_type][enum_].get(modifiers)
-            return self._lookup[event_type].get(enum_)
-        return self._lookup[event_type]
+        modifiers = getattr(event, "modifiers", None)
+        return self._lookup.get((type(event), enum_, modifiers))
 
     @property
     def mouse_is_pressed_types(self):
-        return self._lookup[MouseIsPressed].keys()
+        return self._registered_enums(MouseIsPressed)
 
     @property
     def key_is_pressed_types(self):
-        return self._lookup[KeyIsPressed].keys()
+        return self._registered_enums(KeyIsPressed)
+
+    def _registered_enums(self, event_type):
+        return {
+            enum_ for type_, enum_, _ in self._lookup if type_ is event_type
+        }
 
 
 class _DecoratedInputSchema:
@@ -725,6 +723,7 @@ class _DecoratedInputSchema:
     def __init__(self, *schema):
         self._handler_lookup = collections.defaultdict(dict)
         for (tag, handler) in schema:
+            handler = _event_callback(handler)
             if tag.enums is None:
                 self._handler_lookup[tag.event_type][None] = handler
             else:
@@ -742,13 +741,7 @@ class _DecoratedInputSchema:
 
         if not callback:
             return
-        try:
-            callback(event)
-        except TypeError as e:
-            if "required positional argument" in e.args[0]:
-                callback()
-            else:
-                raise e
+        callback(event)
 
     def enable(self):
         for event_type in self._handler_lookup.keys():
@@ -767,6 +760,21 @@ class _DecoratedInputSchema:
             _update_monitored_key_states()
 
 
+def _event_callback(callback):
+    """Input callbacks may be written with or without an event parameter.
+    That is decided once here, wrapping callbacks which take no arguments,
+    so that dispatching can always pass the event along."""
+
+    try:
+        inspect.signature(callback).bind(None)
+    except TypeError:
+        return lambda event: callback()
+    except ValueError:
+        # no signature available, assume it will accept the event
+        pass
+    return callback
+
+
 def _update_monitored_key_states():
     global monitored_key_states
     sets = tuple(_key_states_to_monitor_lookup.values())
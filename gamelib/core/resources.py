@@ -16,11 +16,18 @@ Find discovered files with:
     get_shader_file
 """
 
+import os
+import pathlib
+import functools
 import collections
+import concurrent.futures
 
 
+_SEARCH_WORKERS = min(8, os.cpu_count() or 1)
+
 _resource_roots = []
-_resource_cache = collections.defaultdict(list)
+# filename -> {parent directory name -> path}, first discovered path wins
+_resource_cache = collections.defaultdict(dict)
 _shader_extensions = (".glsl",)
 _image_extensions = (".jpg", ".png")
 _3d_model_extensions = (".obj",)
@@ -39,6 +46,7 @@ def clear_cache():
     """Clear all cached resources that have been discovered."""
 
     _resource_cache.clear()
+    _clear_lookup_caches()
 
 
 def set_content_roots(*dirs):
@@ -53,8 +61,8 @@ def set_content_roots(*dirs):
     _resource_roots.clear()
     _resource_roots.extend(dirs)
     _resource_cache.clear()
-    for path in dirs:
-        _search_directory(path)
+    _search_directories(dirs)
+    _clear_lookup_caches()
 
 
 def add_content_roots(*dirs):
@@ -67,8 +75,8 @@ def add_content_roots(*dirs):
     """
 
     _resource_roots.extend(dirs)
-    for path in dirs:
-        _search_directory(path)
+    _search_directories(dirs)
+    _clear_lookup_caches()
 
 
 def add_supported_extensions(*extensions):
@@ -87,10 +95,11 @@ def add_supported_extensions(*extensions):
             cleaned.append(ext)
 
     _supported_extensions.extend(cleaned)
-    for path in _resource_roots:
-        _search_directory(path, exts=cleaned)
+    _search_directories(_resource_roots, exts=cleaned)
+    _clear_lookup_caches()
 
 
+@functools.lru_cache(maxsize=1024)
 def get_file(filename):
     """Tries to get a path to the requested filename.
 
@@ -110,25 +119,13 @@ def get_file(filename):
         When the file cannot be located.
     """
 
-    if "/" in filename:
-        dir_, name = filename.split("/")
-    elif "\\" in filename:
-        dir_, name = filename.split("\\")
-    else:
-        dir_, name = None, filename
-
-    if dir_ is None:
-        paths = _resource_cache[name]
-        if paths:
-            return paths[0]
-
-    for path in _resource_cache[name]:
-        if path.parent.name == dir_:
-            return path
-
-    raise KeyError(f"Unable to locate {filename=}.")
+    path = _lookup(filename)
+    if path is None:
+        raise KeyError(f"Unable to locate {filename=}.")
+    return path
 
 
+@functools.lru_cache(maxsize=1024)
 def get_shader_file(name):
     """Tries to get the path to a shader source file with
     the given name.
@@ -147,17 +144,10 @@ def get_shader_file(name):
         When the file for the given name could not be found.
     """
 
-    for ext in _shader_extensions:
-        try:
-            if name.endswith(ext):
-                return get_file(name)
-            else:
-                return get_file(name + ext)
-        except KeyError:
-            pass
-    raise KeyError(f"Couldn't locate {name=}.")
+    return _get_file_with_extensions(name, _shader_extensions)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_image_file(name):
     """Tries to get the path to an image file with the given name.
 
@@ -175,16 +165,10 @@ def get_image_file(name):
         When the file could not be found.
     """
 
-    for ext in _image_extensions:
-        try:
-            if name.endswith(ext):
-                return get_file(name)
-            return get_file(name + ext)
-        except KeyError:
-            pass
-    raise KeyError(f"Couldn't locate {name=}.")
+    return _get_file_with_extensions(name, _image_extensions)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_model_file(name):
     """Tries to get the path to a cached 3d model file.
 
@@ -202,25 +186,117 @@ def get_model_file(name):
         When the file can't be located.
     """
 
-    for ext in _3d_model_extensions:
-        try:
-            if name.endswith(ext):
-                return get_file(name)
-            return get_file(name + ext)
-        except KeyError:
-            pass
+    return _get_file_with_extensions(name, _3d_model_extensions)
+
+
+def _get_file_with_extensions(name, extensions):
+    """Shared implementation for the get_*_file shortcuts. A name which
+    already has one of the extensions is looked up directly."""
+
+    if name.endswith(extensions):
+        return get_file(name)
+    for ext in extensions:
+        path = _lookup(name + ext)
+        if path is not None:
+            return path
     raise KeyError(f"Couldn't locate {name=}.")
 
 
-def _search_directory(path, exts=None):
-    """Search through the given directory path recursively and cache files
-    found with supported extensions."""
+def _lookup(filename):
+    """Finds the cached path for filename, or None if it isn't known."""
 
-    assert path.is_dir()
-    exts = exts or _supported_extensions
+    if "/" in filename:
+        dir_, name = filename.split("/")
+    elif "\\" in filename:
+        dir_, name = filename.split("\\")
+    else:
+        dir_, name = None, filename
 
-    for path in path.iterdir():
-        if path.is_dir():
-            _search_directory(path)
-        elif any(path.name.endswith(ext) for ext in exts):
-            _resource_cache[path.name].append(path)
+    paths = _resource_cache.get(name)
+    if not paths:
+        return None
+    if dir_ is None:
+        return next(iter(paths.values()))
+    return paths.get(dir_)
+
+
+def _clear_lookup_caches():
+    """Lookups are memoized, so they need to be forgotten whenever the
+    underlying resource cache changes."""
+
+    get_file.cache_clear()
+    get_shader_file.cache_clear()
+    get_image_file.cache_clear()
+    get_model_file.cache_clear()
+
+
+def _search_directories(paths, exts=None):
+    """Search through the given directory paths recursively and cache files
+    found with supported extensions.
+
+    Each top level subdirectory is walked on a thread pool, since listing
+    directories is mostly spent in syscalls which release the GIL. Results
+    are merged in the order they were submitted so the first discovered
+    path still wins."""
+
+    exts = tuple(exts or _supported_extensions)
+    linked = set()
+    found = []
+    with concurrent.futures.ThreadPoolExecutor(_SEARCH_WORKERS) as pool:
+        for path in paths:
+            assert path.is_dir()
+            files, subdirectories = _scan_directory(path, linked)
+            found.append(files)
+            for subdirectory in subdirectories:
+                walk = _scandir_recursive(subdirectory, linked)
+                found.append(pool.submit(list, walk))
+
+    for entries in found:
+        if isinstance(entries, concurrent.futures.Future):
+            entries = entries.result()
+        for entry in entries:
+            if entry.name.endswith(exts):
+                parent = os.path.basename(os.path.dirname(entry.path))
+                _resource_cache[entry.name].setdefault(
+                    parent, pathlib.Path(entry.path)
+                )
+
+
+def _scandir_recursive(root, linked):
+    """Yields os.DirEntry objects for every file found beneath root, walking
+    the tree with an explicit stack rather than recursing."""
+
+    stack = [root]
+    while stack:
+        files, subdirectories = _scan_directory(stack.pop(), linked)
+        yield from files
+        # reversed so subdirectories are visited in the order they're listed
+        stack.extend(reversed(subdirectories))
+
+
+def _scan_directory(path, linked):
+    """Lists a single directory, returning its files as os.DirEntry objects
+    and its subdirectories as paths.
+
+    DirEntry caches the file type reported by the os while listing the
+    directory, so unlike pathlib.Path.is_dir() this doesn't need an extra
+    stat call for each entry. Symlinked directories are followed, but the
+    `linked` set of targets ensures each is only entered once."""
+
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    files.append(entry)
+                    continue
+                if entry.is_symlink():
+                    target = os.path.realpath(entry.path)
+                    if target in linked:
+                        continue
+                    linked.add(target)
+                subdirectories.append(entry.path)
+    except PermissionError:
+        pass
+    return files, subdirectories
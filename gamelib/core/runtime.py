@@ -103,25 +103,25 @@ def update():
     specified in the config.
     """
 
-    now = time.Clock.now()
-    next_frame = _render_clock.remaining(now=now)
-    next_update = _update_clock.remaining(now=now)
-    threaded_schedule.update()
-    schedule.update()
-
-    if next_frame < next_update:
+    while True:
+        now = time.Clock.now()
+        threaded_schedule.update(now=now)
+        schedule.update(now=now)
+        next_frame = _render_clock.remaining(now=now)
+        next_update = _update_clock.remaining(now=now)
+        if next_frame >= next_update:
+            break
+        # a frame is due before the next update, present it first
         _render_clock.tick(config.fps)
         window.swap_buffers()
-        _render_clock.tick(config.fps)
-        update()
-    else:
-        if _render_func != _dummy_func:
-            window.clear()
-            _render_func()
-        dt = _update_clock.tick(config.tps)
-        window.poll_for_user_input(dt)
-        events.publish(events.Update(dt))
-        events.publish(events.InternalUpdate(dt))
+
+    if _render_func != _dummy_func:
+        window.clear()
+        _render_func()
+    dt = _update_clock.tick(config.tps)
+    window.poll_for_user_input(dt)
+    events.publish(events.Update(dt))
+    events.publish(events.InternalUpdate(dt))
 
 
 def exit():
@@ -98,11 +98,19 @@ class Schedule:
         for frequency, callback in function_timings:
             self.add(callback, frequency)
 
-    def update(self):
+    def update(self, *, now=None):
         """Checks the Schedule for expired clocks and calls the registered
-        callback functions."""
+        callback functions.
 
-        now = time.time()
+        Parameters
+        ----------
+        now : float, optional
+            Keyword argument to pass in the current time instead of
+            calculating it in the function call. Can be calculated with
+            Clock.now().
+        """
+
+        now = now or time.time()
         clocks = sorted(
             [c for c in self._callbacks.keys() if c.remaining(now=now) < 0],
             key=lambda c: c.remaining(now=now),
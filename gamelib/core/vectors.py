@@ -1,5 +1,3 @@
-from typing import Iterable
-
 import numpy as np
 
 
@@ -100,9 +98,15 @@ class VectorType(np.ndarray):
             # defaults to zeros
             return
         elif len(args) == 1:
+            if getattr(args[0], "ndim", None) == 0:
+                # numpy scalars and 0-d arrays are scalars, not iterables
+                return
             # args might be a single iterable
-            if isinstance(args[0], Iterable):
-                self._parse_iter(args[0])
+            try:
+                iterator = iter(args[0])
+            except TypeError:
+                return
+            self._parse_iter(iterator)
         # else iterate over args
         else:
             self._parse_iter(args)
@@ -181,8 +181,9 @@ def poll_for_user_input(dt):
     event system."""
 
     eval(_poll_for_input, {}, {"self": _window})
-    while _queued_input:
-        events.publish(_queued_input.pop(0))
+    queued = _queued_input.copy()
+    _queued_input.clear()
+    events.publish_many(queued)
     dispatch_is_pressed_events(dt)
 
 
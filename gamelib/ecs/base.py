@@ -105,7 +105,7 @@ component.
 >>> for _ in range(10):
 ...     Physical.create((0, 0), 0)
 >>> Physical.internal_length
-16
+14
 >>> len(Physical)
 13
 
@@ -298,11 +298,13 @@ array([], dtype=int64)
 """
 
 import collections
+import functools
 import itertools
 
 from typing import Dict
 from typing import Iterable
 from typing import Any
+from typing import Tuple
 
 import numpy as np
 
@@ -327,7 +329,7 @@ class IdGenerator:
         self._counter = itertools.count(start)
         self._prev = -1
         self._largest = -1
-        self._recycled = []
+        self._recycled = collections.deque()
 
     def __repr__(self):
         if self._recycled:
@@ -345,12 +347,13 @@ class IdGenerator:
         """
 
         if self._recycled:
-            id = self._recycled.pop(0)
+            id = self._recycled.popleft()
         else:
             id = next(self._counter)
             self._prev = id
 
-        self._largest = max(self._largest, id)
+        if id > self._largest:
+            self._largest = id
         return id
 
     @property
@@ -380,7 +383,7 @@ class IdGenerator:
         if not self._recycled or self._recycled[-1] < id:
             self._recycled.append(id)
         else:
-            for i, v in enumerate(self._recycled[:]):
+            for i, v in enumerate(self._recycled):
                 if id == v:
                     # dont allow duplicates
                     return
@@ -390,6 +393,23 @@ class IdGenerator:
         if id == self._largest:
             self._seek_largest()
 
+    def recycle_many(self, ids):
+        """Recycle many ids at once. Equivalent to calling recycle for each
+        id, but the ids are merged into the recycled ids in one pass rather
+        than inserted one at a time.
+
+        Parameters
+        ----------
+        ids : Iterable[int]
+        """
+
+        ids = {int(id) for id in ids}
+        if not ids:
+            return
+        self._recycled = collections.deque(sorted(ids.union(self._recycled)))
+        if self._largest in ids:
+            self._seek_largest()
+
     def set_state(self, value):
         """Set the id counter back to this value and recycled id's greater than
         or equal to this value.
@@ -400,12 +420,9 @@ class IdGenerator:
             The id value that the id counter should be reverted to.
         """
 
-        index = 0
-        for i, v in enumerate(reversed(self._recycled)):
-            if v < value:
-                index = len(self._recycled) - i
-                break
-        self._recycled = self._recycled[:index]
+        # recycled ids are kept sorted, so irrelevant ids are all at the end
+        while self._recycled and self._recycled[-1] >= value:
+            self._recycled.pop()
         self._counter = itertools.count(value)
 
     def clamp(self):
@@ -436,6 +453,8 @@ class _ComponentType(type):
     # must be implemented on component classes
     fields: Dict[str, Any]  # any numpy compatible dtype
     arrays: Dict[str, np.ndarray]  # field -> internal array mapping
+    _field_arrays: Tuple[np.ndarray, ...]  # arrays in field order
+    _field_views: Tuple[Any, ...]  # vector type to view a field as, or None
     _data_index: np.ndarray
     _active_length: int
     _initialized: bool = False
@@ -504,9 +523,11 @@ class Component(metaclass=_ComponentType):
     internal arrays will be managed with the annotated dtype."""
 
     fields: Dict[str, Any]  # any numpy compatible dtype
-    arrays: Dict[str, np.ndarray]  # field -> internal array mapping
+    arrays: Dict[str, np.ndarray]  # field -> view into _buffer
+    _buffer: np.ndarray  # structured array backing all the fields
     _data_index: np.ndarray
     _active_length: int
+    _generation: int  # incremented whenever data indices may have moved
     _initialized: bool = False
     _structured_dtype: np.dtype
     _id_gen: IdGenerator
@@ -525,7 +546,6 @@ class Component(metaclass=_ComponentType):
             raise AttributeError("No attributes have been annotated.")
         for field in cls.fields:
             setattr(cls, field, _ComponentElement(cls, field))
-        cls._init_arrays()
         dtypes = []
         for name, dtype in cls.fields.items():
             if dtype in vectors.VectorType.__subclasses__():
@@ -535,8 +555,13 @@ class Component(metaclass=_ComponentType):
             else:
                 dtypes.append((name, np.dtype(dtype)))
         dtypes.append(("id", int))
+        cls._field_views = tuple(
+            dtype if dtype in vectors.VectorType.__subclasses__() else None
+            for dtype in cls.fields.values()
+        )
         cls._structured_dtype = np.dtype(dtypes)
         cls.itemsize = cls._structured_dtype.itemsize
+        cls._init_arrays()
         cls._initialized = True
 
     def __new__(cls, *args, _id=None, **kwargs):
@@ -562,13 +587,17 @@ class Component(metaclass=_ComponentType):
 
         if _id is not None:
             # check if this id exists
-            if cls._data_index[_id] == -1:
+            index = cls._data_index[_id]
+            if index == -1:
                 return None
         else:
             _id = cls._create()
+            index = cls._data_index[_id]
 
         instance = super().__new__(cls)
         instance._id = _id
+        instance._index = index
+        instance._generation = cls._generation
         return instance
 
     def __init__(self, *args, **kwargs):
@@ -584,7 +613,10 @@ class Component(metaclass=_ComponentType):
         """
 
         kwargs.pop("_id", None)  # __new__ kwarg not needed here
-        if args:
+        if len(args) == len(self.fields):
+            # every field is given, write the whole row in one assignment
+            self._buffer[self._get_index()] = (*args, self._id)
+        elif args:
             for field, value in zip(self.fields, args):
                 setattr(self, field, value)
         else:
@@ -594,7 +626,8 @@ class Component(metaclass=_ComponentType):
 
     def __repr__(self):
         values = ", ".join(
-            f"{field}={getattr(self, field)}" for field in self.fields
+            f"{field}={value}"
+            for field, value in zip(self.fields, self.values)
         )
         return f"<{self.__class__.__name__}(id={self.id}, {values})>"
 
@@ -617,7 +650,24 @@ class Component(metaclass=_ComponentType):
     def values(self):
         """Get the values for this instance's annotated attributes."""
 
-        return tuple(getattr(self, name) for name in self.fields)
+        index = self._get_index()
+        if index == -1:
+            return (None,) * len(self._field_arrays)
+        return tuple(
+            array[index] if view is None else array[index].view(view)
+            for array, view in zip(self._field_arrays, self._field_views)
+        )
+
+    def _get_index(self):
+        """Gets the index into the internal arrays for this instance. The index
+        is cached and only looked up again once the component data might
+        have been shuffled around by a destroy or clear."""
+
+        cls = type(self)
+        if self._generation != cls._generation:
+            self._index = cls._data_index[self._id]
+            self._generation = cls._generation
+        return self._index
 
     @classmethod
     def create(cls, *args, **kwargs):
@@ -663,6 +713,9 @@ class Component(metaclass=_ComponentType):
     def view_raw_arrays(cls):
         """Gets the raw internal arrays (unmasked).
 
+        This is the internal storage itself rather than a copy, so it is only
+        valid until the component next reallocates.
+
         Returns
         -------
         np.ndarray:
@@ -670,11 +723,7 @@ class Component(metaclass=_ComponentType):
             aggregate of all the annotated attributes of this component.
         """
 
-        combined = np.empty(cls.internal_length, cls._structured_dtype)
-        for name in cls.fields:
-            combined[name] = cls.arrays[name]
-        combined["id"] = cls.arrays["id"]
-        return combined
+        return cls._buffer
 
     @classmethod
     def destroy(cls, target):
@@ -699,11 +748,12 @@ class Component(metaclass=_ComponentType):
             return
 
         # swap good data on the end of the arrays into this data slot
+        cls._generation += 1
         cls._active_length -= 1
-        swapped_id = cls.arrays["id"][cls._active_length]
-        for array in cls.arrays.values():
-            array[index] = array[cls._active_length]
-        cls._data_index[swapped_id] = index
+        if index != cls._active_length:
+            swapped_id = cls.arrays["id"][cls._active_length]
+            cls._buffer[index] = cls._buffer[cls._active_length]
+            cls._data_index[swapped_id] = index
         cls._data_index[id] = -1
 
         # maybe shrink arrays
@@ -719,6 +769,21 @@ class Component(metaclass=_ComponentType):
         for c in cls.get_subclasses():
             c._init_arrays()
 
+    @classmethod
+    def _destroy_bulk(cls, ids):
+        """Destroys many components at once. When the ids account for every
+        active component of this type the storage is simply reset rather than
+        swap-deleting them one at a time."""
+
+        ids = np.unique(ids)
+        ids = ids[(ids >= 0) & (ids < len(cls._data_index))]
+        ids = ids[cls._data_index[ids] != -1]
+        if len(ids) == cls._active_length:
+            cls._init_arrays()
+            return
+        for id in ids:
+            cls.destroy(id)
+
     @classmethod
     def indices_from_ids(cls, ids):
         """Gets the indices into the internal arrays for the given ids.
@@ -744,9 +809,8 @@ class Component(metaclass=_ComponentType):
             )
             if new_length == cls.internal_length:
                 return
-            for field, array in cls.arrays.items():
-                array = cls.arrays[field]
-                cls.arrays[field] = _reallocate_array(array, new_length, -1)
+            cls._buffer = _reallocate_array(cls._buffer, new_length, -1)
+            cls._bind_arrays()
 
         # shrink the index
         necessary_length = cls._id_gen.largest_active + 1
@@ -761,20 +825,26 @@ class Component(metaclass=_ComponentType):
     def _init_arrays(cls):
         """Allocate the initial internal arrays."""
 
-        cls.arrays = dict()
-        for field, dtype in cls.fields.items():
-            if isinstance(dtype, type) and issubclass(
-                dtype, vectors.VectorType
-            ):
-                dtype = dtype.as_dtype()
-            cls.arrays[field] = np.zeros(_STARTING_LENGTH, dtype)
-        cls.arrays["id"] = np.zeros(_STARTING_LENGTH, int)
+        cls._buffer = np.zeros(_STARTING_LENGTH, cls._structured_dtype)
+        cls._bind_arrays()
 
         cls._data_index = np.zeros(_STARTING_LENGTH, int)
         cls._data_index[:] = -1
         cls._active_length = 0
+        cls._generation = getattr(cls, "_generation", 0) + 1
         cls._id_gen = IdGenerator()
 
+    @classmethod
+    def _bind_arrays(cls):
+        """Point the per-field arrays at the current structured buffer. These
+        are views, so this needs to be redone whenever _buffer is
+        reallocated."""
+
+        cls.arrays = {
+            name: cls._buffer[name] for name in cls._structured_dtype.names
+        }
+        cls._field_arrays = tuple(cls.arrays[name] for name in cls.fields)
+
     @classmethod
     def _create(cls):
         """Responsible for bookkeeping and setting aside storage if necessary
@@ -789,10 +859,10 @@ class Component(metaclass=_ComponentType):
             )
 
         index = cls._active_length
-        if index >= len(cls):
+        if index >= cls.internal_length:
             new_length = index * 1.4
-            for field, arr in cls.arrays.items():
-                cls.arrays[field] = _reallocate_array(arr, new_length, -1)
+            cls._buffer = _reallocate_array(cls._buffer, new_length, -1)
+            cls._bind_arrays()
         cls._active_length += 1
         cls._data_index[id] = index
         cls.arrays["id"][index] = id
@@ -818,7 +888,7 @@ class _ComponentElement:
         if obj is None:
             return self._owner.arrays[self._field][: len(self._owner)]
 
-        data_index = self._owner.get_index(obj.id)
+        data_index = obj._get_index()
         if data_index == -1:
             return None
 
@@ -830,7 +900,7 @@ class _ComponentElement:
     def __set__(self, obj, value):
         """Sets a single value into the internal array."""
 
-        data_index = self._owner.get_index(obj.id)
+        data_index = obj._get_index()
         if data_index == -1:
             return
         self._owner.arrays[self._field][data_index] = value
@@ -1001,6 +1071,7 @@ class Entity(metaclass=_EntityType):
     _length: int
     _entity_number = 0  # derived automatically for subclasses
     _field_by_type: Dict[_ComponentType, str]
+    _field_names: Tuple[str, ...]
 
     def __init_subclass__(cls):
         """Inspect the annotated attributes and initialize internals
@@ -1022,6 +1093,7 @@ class Entity(metaclass=_EntityType):
             )
             cls._field_by_type[component_type] = field
             setattr(cls, field, _BoundComponent(cls, field, component_type))
+        cls._field_names = tuple(cls.fields)
         cls._init_arrays()
         cls._length = 0
 
@@ -1061,11 +1133,23 @@ class Entity(metaclass=_EntityType):
 
         kwargs.pop("_id", None)  # __new__ kwarg not needed here
         if args:
-            for field, arg in zip(self.fields, args):
-                setattr(self, field, arg)
+            bindings = zip(self._field_names, args)
         elif kwargs:
-            for field, arg in kwargs.items():
-                setattr(self, field, arg)
+            for name in kwargs:
+                if name not in self.fields:
+                    raise TypeError(
+                        f"{type(self).__name__}() got an unexpected keyword "
+                        f"argument {name!r}"
+                    )
+            bindings = kwargs.items()
+        else:
+            return
+        # a freshly created entity has nothing cached yet, so the component
+        # ids can be written straight into the data row
+        data_index = _EntityType._global.data_index[self._id]
+        arrays = self.arrays
+        for field, component in bindings:
+            arrays[field][data_index] = component.id
 
     def __repr__(self):
         components = ", ".join(
@@ -1283,15 +1367,20 @@ class Entity(metaclass=_EntityType):
             Component.clear()
             return
 
-        for c in [cls] + cls.get_subclasses():
+        entity_types = cls.get_subclasses()
+        bound_ids = collections.defaultdict(list)
+        for c in entity_types:
             for field, comp_type in c.fields.items():
-                for i in c.arrays[field][: c._length]:
-                    comp_type.destroy(i)
-            for i in c.ids:
-                cls._global.id_gen.recycle(i)
-
-            cls._global.data_index[c.ids] = -1
-            cls._global.type_index[c.ids] = -1
+                bound_ids[comp_type].append(c.arrays[field][: c._length])
+        for comp_type, ids in bound_ids.items():
+            comp_type._destroy_bulk(np.concatenate(ids))
+
+        for c in entity_types:
+            ids = c.ids
+            cls._global.id_gen.recycle_many(ids)
+            cls._global.data_index[ids] = -1
+            cls._global.type_index[ids] = -1
+            cls._global.existing -= c._length
             c._init_arrays()
 
     @classmethod
@@ -1325,22 +1414,22 @@ class Entity(metaclass=_EntityType):
     def _get_new_data_index(cls):
         val = cls._length
         cls._length += 1
-        if cls._length >= len(cls):
+        if cls._length >= cls.internal_length:
             cls._grow_arrays()
         return val
 
     @classmethod
     def _grow_arrays(cls):
-        new_length = int(len(cls) * 1.4)
+        new_length = int(cls.internal_length * 1.4)
         for name, array in cls.arrays.items():
             cls.arrays[name] = _reallocate_array(array, new_length, fill=-1)
 
     @classmethod
     def _consider_shrinking(cls):
         # shrink internal data arrays
-        if len(cls) > 1.7 * cls._length:
+        if cls.internal_length > 1.7 * cls._length:
             new_length = max(int(cls._length * 1.2), _STARTING_LENGTH)
-            if new_length == len(cls):
+            if new_length == cls.internal_length:
                 return
             for field, array in cls.arrays.items():
                 array = cls.arrays[field]
@@ -1359,18 +1448,27 @@ class Entity(metaclass=_EntityType):
 class _EntityMask:
     """Responsible for masking a component so that it only show the indices
     which are associated with a certain Entity type. This is a barebones
-    implementation for now."""
+    implementation for now.
 
-    _initialized = False
+    Component fields are exposed as properties on a subclass generated once
+    per component type, see `_mask_type`."""
+
+    def __new__(cls, entity_type, component_type):
+        if cls is _EntityMask:
+            cls = _mask_type(component_type)
+        return super().__new__(cls)
 
     def __init__(self, entity_type, component_type):
         """The component and entity types this mask should act upon."""
 
         self._entity = entity_type
         self._component = component_type
-        self._initialized = True
 
-    def __getattr__(self, name):
+    @property
+    def ids(self):
+        return self._entity.get_component_ids(self._component)
+
+    def _get_field(self, name):
         """Retrieve the array from the component type specified in __init__,
         but masked to contain only the indices relevant to this entity type.
 
@@ -1378,38 +1476,24 @@ class _EntityMask:
         a copy of the array, not a view. In the future this class may help to
         get around this problem by implementing mathematical dunder methods."""
 
-        if name not in self._component.fields and name != "ids":
-            raise AttributeError(f"name not in {self._component.fields!r}.")
-        ids = self._entity.get_component_ids(self._component)
-        if name == "ids":
-            return ids
-        indices = self._component.indices_from_ids(ids)
-        proxy = _MaskedArrayProxy(getattr(self._component, name), indices)
-        return proxy
-
-    def __setattr__(self, name, value):
-        if not self._initialized:
-            super().__setattr__(name, value)
-        elif name in self._component.fields:
-            if isinstance(value, _MaskedArrayProxy):
-                # the only time an array proxy is passed in here
-                # is when is has been called like the following:
-                #   _EntityMask.some_component_attribute += 1_000
-                # The proxy takes care of the += operation and is
-                # trying to be rebound the the _EntityMask object,
-                # which we don't want
-                return
+        return _MaskedArrayProxy(getattr(self._component, name), self._indices)
 
-            # otherwise we might be trying to set the entity mask something
-            # like so:
-            #   _EntityMask.attr1 = _EntityMask.attr2 + 100
-            # Here we are passing in an array like to replace the current
-            # array so we can overwrite the storage directly
-            ids = self._entity.get_component_ids(self._component)
-            indices = self._component.indices_from_ids(ids)
-            getattr(self._component, name)[indices] = value
-        else:
-            super().__setattr__(name, value)
+    def _set_field(self, name, value):
+        if isinstance(value, _MaskedArrayProxy):
+            # the only time an array proxy is passed in here
+            # is when is has been called like the following:
+            #   _EntityMask.some_component_attribute += 1_000
+            # The proxy takes care of the += operation and is
+            # trying to be rebound the the _EntityMask object,
+            # which we don't want
+            return
+
+        # otherwise we might be trying to set the entity mask something
+        # like so:
+        #   _EntityMask.attr1 = _EntityMask.attr2 + 100
+        # Here we are passing in an array like to replace the current
+        # array so we can overwrite the storage directly
+        getattr(self._component, name)[self._indices] = value
 
     @property
     def _indices(self):
@@ -1424,6 +1508,21 @@ class _EntityMask:
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _mask_type(component_type):
+    """Creates the _EntityMask subclass for a component type, with a property
+    for each of the component's fields."""
+
+    def field_property(name):
+        return property(
+            lambda self: self._get_field(name),
+            lambda self, value: self._set_field(name, value),
+        )
+
+    namespace = {name: field_property(name) for name in component_type.fields}
+    return type(f"_{component_type.__name__}Mask", (_EntityMask,), namespace)
+
+
 class _MaskedArrayProxy:
     def __init__(self, raw_array, indices):
         self._array = raw_array
@@ -1490,6 +1589,7 @@ class _BoundComponent:
         self._field = field
         self._cached_name = "__cached_component_" + field
         self._owner = owner
+        self._mask = None
 
     def __get__(self, obj, objtype=None):
         """Gets an instance of the described component that is bound to the
@@ -1498,7 +1598,9 @@ class _BoundComponent:
         described component."""
 
         if obj is None:
-            return _EntityMask(self._owner, self._component_type)
+            if self._mask is None:
+                self._mask = _EntityMask(self._owner, self._component_type)
+            return self._mask
         data_index = _EntityType._global.data_index[obj.id]
         if data_index == -1:
             return None
@@ -1529,18 +1631,14 @@ def _reallocate_array(array, new_length, fill=0):
     new_length = max(int(new_length), _STARTING_LENGTH)
     old_length, *dims = array.shape
     new_array = np.empty((new_length, *dims), array.dtype)
-    new_array[:] = fill
-    if len(array) <= new_length:
-        new_array[: len(array)] = array
-    else:
-        new_array[:] = array[:new_length]
+    # only the trailing space needs the fill value, the rest is overwritten
+    n = min(old_length, new_length)
+    new_array[:n] = array[:n]
+    if n < new_length:
+        new_array[n:] = fill
     return new_array
 
 
-# TODO: An option to allocate the internal arrays using the structured dtype
-#   instead of individual arrays. Using a decorator approach like dataclass
-#   uses might offer a more suitable API for optional features like this.
-
 # TODO: Eventually I will want the option to allocate the arrays using
 #   shared memory. Since they are regularly reallocated this will probably
 #   require a new shared memory module so other processes can easily find the
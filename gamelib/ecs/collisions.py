@@ -1,6 +1,7 @@
 import numpy as np
 
 from gamelib import geometry
+from gamelib.core import gl
 from gamelib.ecs import base
 from gamelib.ecs import Transform
 
@@ -23,28 +24,33 @@ def nearest_entity_hit(ray):
     best = None
     best_distance = geometry.Ray.MAX_DISTANCE
 
-    def _skip_check(bvh):
-        nearest_point = np.minimum(
-            np.abs(ray.origin - bvh.aabb.min),
-            np.abs(ray.origin - bvh.aabb.max),
-        )
-        return np.all(nearest_point > best_distance)
-
     for entity_type in base.Entity.get_subclasses(components=(Hitbox,)):
+        bvhs = list(entity_type.get_mask(Hitbox).bvh)
+        if not bvhs:
+            continue
 
         transform_mask = entity_type.get_mask(Transform)
         if transform_mask is not None:
             transform_ids = transform_mask.ids
+            candidates = range(len(bvhs))
+        else:
+            # untransformed boxes are already in world space, so they can be
+            # culled against the ray in a single batch
+            bmin = np.array([bvh.aabb.min for bvh in bvhs], gl.float)
+            bmax = np.array([bvh.aabb.max for bvh in bvhs], gl.float)
+            nearest = np.minimum(
+                np.abs(ray.origin - bmin), np.abs(ray.origin - bmax)
+            )
+            hits = ray.collides_aabb(bmin=bmin, bmax=bmax)
+            candidates = np.flatnonzero(hits)
 
-        for i, bvh in enumerate(entity_type.get_mask(Hitbox).bvh):
-            if _skip_check(bvh):
-                continue
-
+        for i in candidates:
             if transform_mask is not None:
-                transform = Transform.get(transform_ids[i])
-                ray.to_object_space(transform)
+                ray.to_object_space(Transform.get(transform_ids[i]))
+            elif np.all(nearest[i] > best_distance):
+                continue
 
-            dist = ray.collides_bvh(bvh)
+            dist = ray.collides_bvh(bvhs[i])
             if dist is False:
                 continue
             elif dist < best_distance:
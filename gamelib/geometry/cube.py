@@ -23,6 +23,6 @@ class Cube(base.Model):
             1, 5, 6, 1, 6, 2,  # +x face
             0, 4, 5, 0, 5, 1,  # -y face
             2, 6, 7, 2, 7, 3,  # +y face
-        ])
+        ], gl.uint)
         # fmt: on:
         super().__init__(vertices, triangles, **kwargs)
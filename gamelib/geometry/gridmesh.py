@@ -17,23 +17,21 @@ class GridMesh(base.Model):
             How much space the place occupies. Scale 1000 == 1000x1000
         """
 
-        x = y = np.linspace(0, scale, lod + 1)
-        xv, yv = np.meshgrid(x, y)
-        vertices = np.empty(xv.size * 3, gl.float)
-        vertices[0::3] = xv.flatten()
-        vertices[1::3] = yv.flatten()
-        vertices[2::3] = 0
+        steps = np.linspace(0, scale, lod + 1, dtype=gl.float)
+        vertices = np.zeros(((lod + 1) ** 2, 3), gl.float)
+        # broadcast the steps straight into a (row, column, xyz) view of the
+        # vertices rather than building an x/y meshgrid to copy from
+        grid = vertices.reshape(lod + 1, lod + 1, 3)
+        grid[:, :, 0] = steps
+        grid[:, :, 1] = steps[:, None]
 
-        num_quads = lod * lod
-        order = np.array((0, lod + 1, lod + 2, 0, lod + 2, 1))
-        triangles = np.empty(order.size * num_quads, gl.uint)
-        ptr = 0
-        for x in range(lod):
-            for y in range(lod):
-                index = (y * (lod + 1)) + x
-                triangles[ptr : ptr + order.size] = order + index
-                ptr += order.size
+        # index of each quad's first vertex, quads ordered column by column
+        columns = np.arange(lod, dtype=gl.uint)
+        rows = columns * gl.uint.type(lod + 1)
+        corners = columns[:, None] + rows
+        order = np.array((0, lod + 1, lod + 2, 0, lod + 2, 1), gl.uint)
+        triangles = np.empty((lod, lod, order.size), gl.uint)
+        np.add(corners[:, :, None], order, out=triangles)
+        triangles = triangles.reshape(-1, 3)
 
-        vertices = gl.coerce_array(vertices, gl.vec3)
-        triangles = gl.coerce_array(triangles, gl.uvec3)
         super().__init__(vertices, triangles, **kwargs)
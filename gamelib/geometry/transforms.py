@@ -41,6 +41,23 @@ def normalize(vector):
     return vector
 
 
+def _cos_sin(theta):
+    """Cosine and sine of theta given in degrees."""
+
+    theta = _radians(theta)
+    return np.cos(theta), np.sin(theta)
+
+
+def _identity4(out, dtype):
+    """Returns `out` reset to the identity, or a new identity matrix."""
+
+    if out is None:
+        return np.identity(4, dtype)
+    out.fill(0)
+    np.fill_diagonal(out, 1)
+    return out
+
+
 class Mat3:
     """
     Namespace for 3x3 transformation matrices.
@@ -313,7 +330,7 @@ class Mat4:
         # fmt: on
 
     @staticmethod
-    def rotate_about_x(theta, dtype=gl.float):
+    def rotate_about_x(theta, dtype=gl.float, *, out=None):
         """4x4 rotation matrix about the positive x axis.
 
         Parameters
@@ -321,18 +338,24 @@ class Mat4:
         theta : float
             Angle measured in degrees.
         dtype : Any, optional
+        out : np.ndarray, optional
+            4x4 array to write the matrix into instead of allocating one.
 
         Returns
         -------
         np.ndarray
         """
 
-        mat = np.identity(4, gl.float)
-        mat[0:3, 0:3] = Mat3.rotate_about_x(theta, dtype)
-        return mat.T
+        mat4 = _identity4(out, dtype)
+        cos, sin = _cos_sin(theta)
+        mat4[1, 1] = cos
+        mat4[1, 2] = sin
+        mat4[2, 1] = -sin
+        mat4[2, 2] = cos
+        return mat4
 
     @staticmethod
-    def rotate_about_y(theta, dtype=gl.float):
+    def rotate_about_y(theta, dtype=gl.float, *, out=None):
         """4x4 rotation matrix about the positive y axis.
 
         Parameters
@@ -340,18 +363,24 @@ class Mat4:
         theta : float
             Angle measured in degrees.
         dtype : Any, optional
+        out : np.ndarray, optional
+            4x4 array to write the matrix into instead of allocating one.
 
         Returns
         -------
         np.ndarray
         """
 
-        mat = np.identity(4, dtype)
-        mat[0:3, 0:3] = Mat3.rotate_about_y(theta, dtype)
-        return mat.T
+        mat4 = _identity4(out, dtype)
+        cos, sin = _cos_sin(theta)
+        mat4[0, 0] = cos
+        mat4[0, 2] = -sin
+        mat4[2, 0] = sin
+        mat4[2, 2] = cos
+        return mat4
 
     @staticmethod
-    def rotate_about_z(theta, dtype=gl.float):
+    def rotate_about_z(theta, dtype=gl.float, *, out=None):
         """4x4 rotation matrix about the positive z axis.
 
         Parameters
@@ -359,18 +388,24 @@ class Mat4:
         theta : float
             Angle measured in degrees.
         dtype : Any, optional
+        out : np.ndarray, optional
+            4x4 array to write the matrix into instead of allocating one.
 
         Returns
         -------
         np.ndarray
         """
 
-        mat4 = np.identity(4, dtype)
-        mat4[0:3, 0:3] = Mat3.rotate_about_z(theta, dtype)
-        return mat4.T
+        mat4 = _identity4(out, dtype)
+        cos, sin = _cos_sin(theta)
+        mat4[0, 0] = cos
+        mat4[0, 1] = sin
+        mat4[1, 0] = -sin
+        mat4[1, 1] = cos
+        return mat4
 
     @staticmethod
-    def rotate_about_axis(axis, theta, dtype=gl.float):
+    def rotate_about_axis(axis, theta, dtype=gl.float, *, out=None):
         """4x4 rotation matrix about an arbitrary 3 dimensional axis.
 
         Parameters
@@ -380,15 +415,29 @@ class Mat4:
         theta : float
             Angle measured in degrees.
         dtype : Any, optional
+        out : np.ndarray, optional
+            4x4 array to write the matrix into instead of allocating one.
 
         Returns
         -------
         np.ndarray
         """
 
-        mat4 = np.identity(4, dtype)
-        mat4[0:3, 0:3] = Mat3.rotate_about_axis(axis, theta, dtype)
-        return mat4.T
+        axis = np.asarray(axis, "f4")
+        normalize(axis)
+        x, y, z = axis
+        cos, sin = _cos_sin(theta)
+        k = 1 - cos
+
+        mat4 = _identity4(out, dtype)
+        # fmt: off
+        mat4[0:3, 0:3] = (
+            (cos + x * x * k, z * sin + x * y * k, -y * sin + x * z * k),
+            (x * y * k - z * sin, cos + y * y * k, x * sin + y * z * k),
+            (y * sin + x * z * k, -x * sin + y * z * k, cos + z * z * k),
+        )
+        # fmt: on
+        return mat4
 
     @staticmethod
     def scale(scale_vector, dtype=gl.float):
@@ -443,12 +492,39 @@ class Mat4:
 
     @classmethod
     def model_transform(
-        cls, translation=(0, 0, 0), scale=(1, 1, 1), axis=(0, 0, 1), theta=0.0
+        cls,
+        translation=(0, 0, 0),
+        scale=(1, 1, 1),
+        axis=(0, 0, 1),
+        theta=0.0,
+        *,
+        out=None,
     ):
-        scale = cls.scale(scale)
-        rotation = cls.rotate_about_axis(axis, theta)
-        translation = cls.translation(translation)
-        return scale.dot(rotation).dot(translation)
+        """Combined scale, rotation and translation matrix.
+
+        Parameters
+        ----------
+        translation : Sequence
+        scale : Sequence
+        axis : Sequence
+        theta : float
+            Rotation angle in degrees.
+        out : np.ndarray, optional
+            4x4 array to write the matrix into instead of allocating one.
+
+        Returns
+        -------
+        np.ndarray
+        """
+
+        mat4 = cls.rotate_about_axis(axis, theta, out=out)
+        # equivalent to scale.dot(rotation).dot(translation), written
+        # directly into the rotation matrix: scaling multiplies the rows
+        # of the rotation and translation fills in the bottom row
+        for i in range(3):
+            mat4[i, 0:3] *= scale[i]
+        mat4[3, 0:3] = translation
+        return mat4
 
 
 class Transform:
@@ -617,8 +693,8 @@ class Transform:
     def _update_matrix(self):
         """Updates the OpenGL matrix."""
 
-        self._matrix[:] = Mat4.model_transform(
-            self.pos, self.scale, self.axis, self.theta
+        Mat4.model_transform(
+            self.pos, self.scale, self.axis, self.theta, out=self._matrix
         )
 
 
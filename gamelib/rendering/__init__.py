@@ -2,3 +2,4 @@ from .gpu import Renderer
 from .gpu import TransformFeedback
 from .camera import PerspectiveCamera
 from .camera import OrthogonalCamera
+from ._global import refresh_global_uniforms
@@ -13,7 +13,11 @@ class GlobalUniformBlock(uniforms.UniformBlock):
     time = uniforms.ArrayStorage(gamelib.gl.float)
 
 
-def _update_global_uniforms(_):
+def refresh_global_uniforms():
+    """Re-read the global uniforms from the window, primary camera and
+    runtime clock. This normally happens each update, but can be called
+    to refresh them without ticking the rest of the application."""
+
     x, y = gamelib.get_cursor()
     global_uniforms.cursor = (
         x / gamelib.get_width(),
@@ -25,5 +29,9 @@ def _update_global_uniforms(_):
     global_uniforms.time = gamelib.get_time()
 
 
+def _update_global_uniforms(_):
+    refresh_global_uniforms()
+
+
 global_uniforms = GlobalUniformBlock()
 gamelib.subscribe(events.InternalUpdate, _update_global_uniforms)
@@ -89,10 +89,11 @@ class Buffer:
             f"size={self.size} dtype={self.dtype!r})>"
         )
 
-    def _write_array(self, array, copy=True):
-        if copy:
-            array = array.copy()
-        self._write_bytes(gl.coerce_array(array, self.dtype).tobytes())
+    def _write_array(self, array):
+        # moderngl accepts any buffer, so a byte view of the array is written
+        # rather than first copying the array into a bytes object
+        array = np.ascontiguousarray(gl.coerce_array(array, self.dtype))
+        self._write_bytes(array.reshape(-1).view(np.uint8))
 
     def _write_bytes(self, data):
         if self.gl is None or self.size != len(data):
@@ -203,9 +204,6 @@ class AutoBuffer(Buffer):
         else:
             return data[: self._num_elements]
 
-    def _write_array(self, array):
-        super()._write_array(array, copy=False)
-
     def _write_bytes(self, data):
         nbytes = len(data)
         self._num_elements = nbytes // self.dtype.itemsize
@@ -1,4 +1,6 @@
 import time
+import weakref
+import itertools
 import numpy as np
 
 from typing import Callable
@@ -13,6 +15,10 @@ from gamelib.rendering import buffers
 from gamelib.rendering import textures
 
 _cached_assets = dict()
+# program -> uid of the VertexArray that last wrote its uniforms, held
+# weakly so it doesn't keep programs alive after their shaders are gone
+_uniform_writers = weakref.WeakKeyDictionary()
+_vertex_array_uids = itertools.count()
 
 
 class GPUInstructions:
@@ -115,12 +121,18 @@ class TransformFeedback(GPUInstructions):
         **data_sources,
     ):
         self.sources = data_sources
+        self._result_buffer = None
+        self._outputs_meta = None
+        self._out_dtype = None
+        self._single_output_name = None
         super().__init__(
             shader, mode, automatic_hot_reloading=automatic_hot_reloading
         )
+        self.vao.use_sources(**self.sources)
 
     def source(self, **data_sources):
         self.sources.update(data_sources)
+        self.vao.use_sources(**data_sources)
 
     def transform(self, vertices=None, **data_sources):
         """Issue the transform feedback command. This will block and read back
@@ -142,26 +154,40 @@ class TransformFeedback(GPUInstructions):
             output datatype.
         """
 
-        self.sources.update(data_sources)
-        self.vao = VertexArray(self.shader, **self.sources)
+        self.source(**data_sources)
         if self.vao.glo is None:
             return None
         self.update()
-        out_dtype = np.dtype(
-            [
-                (desc.name, desc.dtype)
-                for desc in self.shader.meta.vertex_outputs.values()
-            ]
-        )
+        if self._outputs_meta is not self.shader.meta:
+            self._cache_outputs()
+        out_dtype = self._out_dtype
         vertices = vertices or self.vao.num_elements
         reserve = vertices * out_dtype.itemsize
-        result_buffer = gamelib.get_context().buffer(reserve=reserve)
-        self.vao.glo.transform(result_buffer, vertices=vertices)
-        array = np.frombuffer(result_buffer.read(), out_dtype)
-        if len(self.shader.meta.vertex_outputs) == 1:
-            return array[next(iter(self.shader.meta.vertex_outputs.keys()))]
+        if self._result_buffer is None or self._result_buffer.size < reserve:
+            if self._result_buffer is not None:
+                self._result_buffer.release()
+            self._result_buffer = gamelib.get_context().buffer(reserve=reserve)
+        self.vao.glo.transform(self._result_buffer, vertices=vertices)
+        # read straight into the result rather than through a bytes object
+        array = np.empty(vertices, out_dtype)
+        self._result_buffer.read_into(array, size=reserve)
+        if self._single_output_name is not None:
+            return array[self._single_output_name]
         return array
 
+    def _cache_outputs(self):
+        """The result layout only changes if the shader is hot reloaded."""
+
+        outputs = self.shader.meta.vertex_outputs
+        self._out_dtype = np.dtype(
+            [(desc.name, desc.dtype) for desc in outputs.values()]
+        )
+        if len(outputs) == 1:
+            self._single_output_name = next(iter(outputs))
+        else:
+            self._single_output_name = None
+        self._outputs_meta = self.shader.meta
+
 
 class Renderer(GPUInstructions):
     """Issues draw calls."""
@@ -232,6 +258,7 @@ class VertexArray:
         """
 
         self._glo = None
+        self._glo_signature = None
         self._dirty = True
         self._auto = auto
         self._mode = mode
@@ -239,8 +266,20 @@ class VertexArray:
         self._instanced_attibutes = set(instanced)
         self._buffers_in_use = dict()
         self._uniforms_in_use = dict()
+        self._constant_uniforms = dict()
+        self._constants_written = False
+        self._uid = next(_vertex_array_uids)
         self._buffer_ids = dict()
-        self._generated_buffers = list()
+        self._generated_buffers = dict()  # id(buffer) -> buffer
+        self._num_elements = None
+        self._num_instances = None
+        self._auto_buffers = None
+        self._attribute_formats = dict()
+        self._attribute_formats_program = None
+        self._uniform_buffers = dict()
+        self._uniform_buffers_program = None
+        self._block_uniforms_meta = None
+        self._block_uniforms_lookup = None
 
         self.shader = shader
         self.use_sources(**data_sources)
@@ -269,15 +308,20 @@ class VertexArray:
         int
         """
 
-        if self._index_buffer:
-            return len(self._index_buffer)
+        if self._num_elements is not None:
+            return self._num_elements
 
-        lengths = [
-            len(vbo)
-            for name, vbo in self._buffers_in_use.items()
-            if name not in self._instanced_attibutes
-        ]
-        return min(lengths)
+        if self._index_buffer:
+            num_elements = len(self._index_buffer)
+        else:
+            num_elements = min(
+                len(vbo)
+                for name, vbo in self._buffers_in_use.items()
+                if name not in self._instanced_attibutes
+            )
+        if self._lengths_are_tracked:
+            self._num_elements = num_elements
+        return num_elements
 
     @property
     def num_instances(self):
@@ -291,44 +335,109 @@ class VertexArray:
 
         if not self._instanced_attibutes:
             return -1
+        if self._num_instances is not None:
+            return self._num_instances
 
-        lengths = [
+        num_instances = min(
             len(vbo)
             for name, vbo in self._buffers_in_use.items()
             if name in self._instanced_attibutes
-        ]
-        return min(lengths)
+        )
+        if self._lengths_are_tracked:
+            self._num_instances = num_instances
+        return num_instances
+
+    @property
+    def _lengths_are_tracked(self):
+        """Buffer lengths can only be cached while every buffer in use was
+        generated by this vertex array, as buffers sourced from elsewhere
+        could be written to without it knowing."""
+
+        in_use = [*self._buffers_in_use.values(), self._index_buffer]
+        return all(
+            buffer is None or id(buffer) in self._generated_buffers
+            for buffer in in_use
+        )
+
+    def _forget_lengths(self):
+        self._num_elements = None
+        self._num_instances = None
 
     @property
     def _buffer_format_tuples(self):
         """(buffer_obj, buffer_format, buffer_name) formatting tuples."""
 
+        program = self.shader.glo
+        if self._attribute_formats_program is not program:
+            # formats come from the program, a hot reload can change them
+            self._attribute_formats = dict()
+            self._attribute_formats_program = program
+
         format_tuples = []
         for name, buffer in self._buffers_in_use.items():
-            moderngl_attr = self.shader.glo[name]
-            strtype = moderngl_attr.shape
-            if strtype == "I":
-                # conform to moderngl expected strfmt dtypes
-                # eventually I'd like to move towards doing
-                # all the shader source code inspection myself,
-                # as the moderngl api doesn't offer all the
-                # metadata I would like it to and weird issues
-                # like this one.
-                strtype = "u"
-            strfmt = f"{moderngl_attr.dimension}{strtype}"
-            if name in self._instanced_attibutes:
-                strfmt += " /i"
+            strfmt = self._attribute_formats.get(name)
+            if strfmt is None:
+                strfmt = self._attribute_format(program, name)
+                self._attribute_formats[name] = strfmt
             format_tuples.append((buffer.gl, strfmt, name))
         return format_tuples
 
+    def _attribute_format(self, program, name):
+        """The moderngl buffer format string for the named attribute."""
+
+        moderngl_attr = program[name]
+        strtype = moderngl_attr.shape
+        if strtype == "I":
+            # conform to moderngl expected strfmt dtypes
+            # eventually I'd like to move towards doing
+            # all the shader source code inspection myself,
+            # as the moderngl api doesn't offer all the
+            # metadata I would like it to and weird issues
+            # like this one.
+            strtype = "u"
+        strfmt = f"{moderngl_attr.dimension}{strtype}"
+        if name in self._instanced_attibutes:
+            strfmt += " /i"
+        return strfmt
+
     def update(self):
         """Updates _AutoUniform and AutoBuffer objects."""
 
-        for buffer in self._buffers_in_use.values():
-            if isinstance(buffer, buffers.AutoBuffer):
+        if self._auto_buffers is None:
+            self._auto_buffers = [
+                buffer
+                for buffer in self._buffers_in_use.values()
+                if isinstance(buffer, buffers.AutoBuffer)
+            ]
+        if self._auto_buffers:
+            for buffer in self._auto_buffers:
                 buffer.update()
+            self._forget_lengths()
+        program = self.shader.glo
+        if _uniform_writers.get(program) != self._uid:
+            # programs are shared, so constants need rewriting if another
+            # vertex array has written to this one since we last did
+            _uniform_writers[program] = self._uid
+            self._constants_written = False
+        if not self._constants_written:
+            for uniform in self._constant_uniforms.values():
+                uniform.update(program)
+            self._constants_written = True
         for uniform in self._uniforms_in_use.values():
-            uniform.update(self.shader.glo)
+            uniform.update(program)
+        if self._uniform_buffers:
+            self._update_uniform_buffers(program)
+
+    def _update_uniform_buffers(self, program):
+        if self._uniform_buffers_program is not program:
+            # block bindings are program state, assigned by declaration order
+            for buffer in self._uniform_buffers.values():
+                block = program.get(buffer.name, None)
+                if block is not None:
+                    block.binding = buffer.binding
+            self._uniform_buffers_program = program
+        for buffer in self._uniform_buffers.values():
+            buffer.update()
 
     def use_source(self, name, source):
         """Set a source uniform/buffer.
@@ -347,14 +456,27 @@ class VertexArray:
             self._integrate_buffer(name, source)
         elif name in self.shader.meta.uniforms:
             self._integrate_uniform(name, source)
+        elif name in self._block_uniforms:
+            self._integrate_block_uniform(name, source)
         else:
             self._raise_invalid_source(name)
 
     def use_sources(self, **data_sources):
         """Shorthand for many use_source calls. See use_source"""
 
+        # looked up per call, hot reloading replaces the shader's metadata
+        attribute_names = self.shader.meta.attributes
+        uniform_names = self.shader.meta.uniforms
+        block_uniforms = self._block_uniforms
         for name, source in data_sources.items():
-            self.use_source(name, source)
+            if name in attribute_names:
+                self._integrate_buffer(name, source)
+            elif name in uniform_names:
+                self._integrate_uniform(name, source)
+            elif name in block_uniforms:
+                self._integrate_block_uniform(name, source)
+            else:
+                self._raise_invalid_source(name)
 
     def source_buffers(self, **buffer_sources):
         """Set a buffer source.
@@ -386,6 +508,7 @@ class VertexArray:
             self._index_buffer = self._generate_buffer(
                 indices, gl.uint, auto=False
             )
+        self._forget_lengths()
         self._dirty = True
 
     def source_uniforms(self, **uniform_sources):
@@ -399,8 +522,12 @@ class VertexArray:
             If sourced from a python value it will set the value just once.
         """
 
+        block_uniforms = self._block_uniforms
         for name, uniform in uniform_sources.items():
-            self._integrate_uniform(name, uniform)
+            if name in block_uniforms:
+                self._integrate_block_uniform(name, uniform)
+            else:
+                self._integrate_uniform(name, uniform)
         self._dirty = True
 
     def check_global_uniforms(self, **data_sources):
@@ -408,6 +535,9 @@ class VertexArray:
         for name in self.shader.meta.uniforms:
             if name not in data_sources and name in glob:
                 self._integrate_uniform(name, glob[name])
+        for name in self._block_uniforms:
+            if name not in data_sources and name in glob:
+                self._integrate_block_uniform(name, glob[name])
 
     def flag_dirty(self):
         self._dirty = True
@@ -416,6 +546,8 @@ class VertexArray:
         if attribute not in self.shader.meta.attributes:
             self._raise_invalid_source(attribute)
 
+        self._forget_lengths()
+        self._auto_buffers = None
         current_buffer = self._buffers_in_use.get(attribute, None)
         dtype = self.shader.meta.attributes[attribute].dtype
         if current_buffer is None:
@@ -438,10 +570,44 @@ class VertexArray:
     def _integrate_uniform(self, name, source):
         dtype = self.shader.meta.uniforms[name].dtype
 
-        if not isinstance(source, np.ndarray):
-            source = np.array(source, dtype)
+        if isinstance(source, np.ndarray):
+            self._constant_uniforms.pop(name, None)
+            self._uniforms_in_use[name] = uniforms.AutoUniform(
+                source, dtype, name
+            )
+        else:
+            # python values are constants and only need writing once
+            self._uniforms_in_use.pop(name, None)
+            self._constant_uniforms[name] = uniforms.AutoUniform(
+                np.array(source, dtype), dtype, name
+            )
+            self._constants_written = False
 
-        self._uniforms_in_use[name] = uniforms.AutoUniform(source, dtype, name)
+    @property
+    def _block_uniforms(self):
+        """Mapping of uniform block member names to their block name."""
+
+        meta = self.shader.meta
+        if self._block_uniforms_meta is not meta:
+            # hot reloading replaces the shader's metadata
+            self._block_uniforms_lookup = {
+                name: block.name
+                for block in meta.uniform_blocks.values()
+                for name in block.uniforms
+            }
+            self._block_uniforms_meta = meta
+        return self._block_uniforms_lookup
+
+    def _integrate_block_uniform(self, name, source):
+        block_name = self._block_uniforms[name]
+        buffer = self._uniform_buffers.get(block_name)
+        if buffer is None:
+            blocks = self.shader.meta.uniform_blocks
+            binding = list(blocks).index(block_name)
+            buffer = uniforms.UniformBuffer(blocks[block_name], binding)
+            self._uniform_buffers[block_name] = buffer
+            self._uniform_buffers_program = None
+        buffer.source(name, source)
 
     def _generate_buffer(self, source, dtype, auto=None):
         self._dirty = True
@@ -454,44 +620,54 @@ class VertexArray:
 
         if isinstance(source, np.ndarray):
             buf = buf_type(source, dtype)
-            self._generated_buffers.append(buf)
+            self._generated_buffers[id(buf)] = buf
             return buf
         elif isinstance(source, Callable):
             assert isinstance(source(), np.ndarray)
             buf = buf_type(source, dtype)
-            self._generated_buffers.append(buf)
+            self._generated_buffers[id(buf)] = buf
             return buf
         elif source is not None:
             # fallback to trying to interpret as an array
             array = np.asarray(source, dtype)
             buf = buf_type(array, dtype)
-            self._generated_buffers.append(buf)
+            self._generated_buffers[id(buf)] = buf
             return buf
 
     def _remove_buffer(self, buffer):
         self._dirty = True
-        if buffer in self._generated_buffers:
-            self._generated_buffers.remove(buffer)
+        if self._generated_buffers.pop(id(buffer), None) is not None:
             buffer.gl.release()
 
     def _make_glo(self):
         if any(len(buf) == 0 for buf in self._buffers_in_use.values()):
+            if self._glo is not None:
+                self._glo.release()
+                self._glo = None
             return None
+        ibo = self._index_buffer.gl if self._index_buffer else None
+        format_tuples = self._buffer_format_tuples
+        signature = (self.shader.glo, tuple(format_tuples), ibo)
         if self._glo is not None:
+            if signature == self._glo_signature:
+                # the bindings haven't actually changed, keep the current vao
+                self._dirty = False
+                return
             self._glo.release()
-        ibo = self._index_buffer.gl if self._index_buffer else None
         self._glo = gamelib.get_context().vertex_array(
             self.shader.glo,
-            self._buffer_format_tuples,
+            format_tuples,
             index_buffer=ibo,
             index_element_size=4,
         )
+        self._glo_signature = signature
         self._dirty = False
 
     def _raise_invalid_source(self, name):
         raise ValueError(
             f"{name!r} is not a valid uniform/buffer name for this shader. "
-            f"Valid uniforms: {tuple(self.shader.meta.uniforms.keys())!r}, "
+            f"Valid uniforms: "
+            f"{(*self.shader.meta.uniforms, *self._block_uniforms)!r}, "
             f"valid buffers: {tuple(self.shader.meta.attributes.keys())!r}"
         )
 
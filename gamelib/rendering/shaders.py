@@ -18,6 +18,7 @@ Note that the only one you must be familiar with is the stage directive.
  - Stage Directives (#vert, #tesc, #tese, #geom, #frag)
  - Include Directive (#include "anotherfile.glsl")
  - Keyword / default function parameters
+ - std140 uniform blocks
  - Metadata parsing
 
 
@@ -95,6 +96,23 @@ DEFAULT FUNCTION PARAMETERS
  my_function();                      // SyntaxError, positional args must be given
 
 
+UNIFORM BLOCKS
+
+ Uniform interface blocks are given the std140 layout unless a layout is
+ specified, so the block can be staged on the CPU and uploaded with a single
+ buffer write. The block's members are sourced by name like any other uniform.
+
+ uniform Camera
+ {
+     mat4 view;
+     mat4 proj;
+ };
+
+ // The preprocessor will replace this declaration with:
+ layout(std140) uniform Camera
+ ...
+
+
 METADATA PARSING
 
  The preprocessor also collects metadata about the shader, which is mostly for
@@ -103,6 +121,7 @@ METADATA PARSING
 
 import pathlib
 import re
+import weakref
 
 from typing import Dict
 from typing import List
@@ -111,11 +130,16 @@ from typing import NamedTuple
 
 import numpy as np
 
+import gamelib
 from gamelib.core import resources
 from gamelib.core import gl
 
 
 _cache: Dict[pathlib.Path, "Shader"] = dict()
+# (context, source code, varyings) -> linked program, shared between shaders.
+# Held weakly so programs (and their contexts) live only as long as some
+# shader still uses them.
+_program_cache: Dict[tuple, gl.GLShader] = weakref.WeakValueDictionary()
 
 
 class GLSLUniform(NamedTuple):
@@ -136,6 +160,11 @@ class GLSLVertexOutput(NamedTuple):
     length: int
 
 
+class GLSLUniformBlock(NamedTuple):
+    name: str
+    uniforms: Dict[str, GLSLUniform]
+
+
 class GLSLSampler(NamedTuple):
     name: str
     dtype_str: str
@@ -176,10 +205,11 @@ class ShaderMetaData(NamedTuple):
     functions: Dict[str, GLSLFunctionDefinition]
     includes: List["_IncludeShader"]
     samplers: List[GLSLSampler]
+    uniform_blocks: Dict[str, GLSLUniformBlock]
 
     @classmethod
     def empty(cls):
-        return cls(dict(), dict(), dict(), dict(), list(), list())
+        return cls(dict(), dict(), dict(), dict(), list(), list(), dict())
 
 
 class ShaderSourceCode(NamedTuple):
@@ -233,6 +263,8 @@ class Shader:
     _mtime_ns: float
     _gl_initialized: bool
     _glo: gl.GLShader
+    # preprocessed code that last failed to compile during a hot reload
+    _failed_code: Optional[ShaderSourceCode] = None
 
     def __new__(cls, name=None, *, src=None, no_cache=False, **kwargs):
         """Either return a cached shader or create a new one."""
@@ -308,12 +340,17 @@ class Shader:
             return False
         try:
             code, meta = self._recompile()
-            glo = self._make_glo(code, meta)
-            self._glo = glo
+            if code == self.code or code == self._failed_code:
+                # the files were touched but the program hasn't changed, so
+                # there is nothing new to compile
+                return False
+            self._glo = self._make_glo(code, meta)
             self.code = code
             self.meta = meta
+            self._failed_code = None
             return True
         except GLSLCompilerError as exc:
+            self._failed_code = code
             print(exc)
             return False
         finally:
@@ -356,8 +393,12 @@ class Shader:
         self.meta = meta
 
     def _make_glo(self, code, meta):
+        key = self._program_key(code, meta)
+        glo = _program_cache.get(key)
+        if glo is not None:
+            return glo
         try:
-            return gl.make_shader_glo(
+            glo = gl.make_shader_glo(
                 vert=code.vert,
                 tesc=code.tesc,
                 tese=code.tese,
@@ -367,6 +408,12 @@ class Shader:
             )
         except gl.Error as exc:
             raise GLSLCompilerError(exc, self)
+        _program_cache[key] = glo
+        return glo
+
+    @staticmethod
+    def _program_key(code, meta):
+        return gamelib.get_context(), code, tuple(meta.vertex_outputs)
 
     @classmethod
     def _get_object(cls, name, no_cache):
@@ -510,6 +557,10 @@ class _ShaderPreProcessor:
     _POINTS_OF_INTEREST_REGEX = re.compile(
         r"""
             (?P<include> \#include \s .*? $)
+            | (?P<uniform_block>
+                (\b layout \s* \( [^)]* \) \s*)?
+                \b uniform \s+ \w+ \s* \{ [^}]* \} \s* \w* \s*;
+              )
             | (?P<function> \b \w+ \( [^;{]* \) )
             | (?P<uniform> \b uniform \s \w+ \s \w+ (\[\d+\])?;)
             | (?P<attribute> \b in \s \w+ \s \w+ (\[\d+\])?;)
@@ -613,6 +664,8 @@ class _ShaderPreProcessor:
             return self._handle_include(value)
         elif kind == "function":
             return self._handle_function(value)
+        elif kind == "uniform_block":
+            return self._handle_uniform_block(value)
         elif kind == "uniform":
             return self._handle_uniform(value)
         elif kind == "attribute":
@@ -636,6 +689,7 @@ class _ShaderPreProcessor:
 
         self._meta.functions.update(shader.meta.functions)
         self._meta.uniforms.update(shader.meta.uniforms)
+        self._meta.uniform_blocks.update(shader.meta.uniform_blocks)
         self._meta.includes.append(shader)
         self._meta.includes.extend(shader.meta.includes)
         return shader.code.common
@@ -659,6 +713,19 @@ class _ShaderPreProcessor:
             self._meta.uniforms[desc.name] = desc
         return raw_match
 
+    def _handle_uniform_block(self, raw_match):
+        desc = self._create_uniform_block_desc(raw_match)
+        # the match can span lines, which the newline group won't see
+        self._line_number += raw_match.count("\n")
+        if desc is None:
+            # members we can't lay out (structs for example) leave the block
+            # to be handled entirely by the glsl code, as it was written
+            return raw_match
+        self._meta.uniform_blocks[desc.name] = desc
+        if raw_match.startswith("layout"):
+            return raw_match
+        return "layout(std140) " + raw_match
+
     def _handle_attribute(self, raw_match):
         if self._current_stage == "vert":
             desc = self._create_attribute_desc(raw_match)
@@ -677,6 +744,18 @@ class _ShaderPreProcessor:
             return GLSLSampler(name, dtype)
         return GLSLUniform(name, dtype, length)
 
+    def _create_uniform_block_desc(self, raw):
+        name, body = re.search(r"uniform\s+(\w+)\s*{([^}]*)}", raw).groups()
+        uniforms = dict()
+        for m in re.finditer(r"(\w+)\s+(\w+)\s*(\[\d+\])?\s*;", body):
+            dtype, member, maybe_length = m.groups()
+            length = int(maybe_length.strip("[]")) if maybe_length else 1
+            dtype = _gl_dtype(dtype)
+            if dtype is None:
+                return None
+            uniforms[member] = GLSLUniform(member, dtype, length)
+        return GLSLUniformBlock(name, uniforms)
+
     def _create_vertex_output_desc(self, raw):
         _, dtype, name, length = self._parse_kw_dtype_name_len(raw)
         return GLSLVertexOutput(name, dtype, length)
@@ -700,7 +779,24 @@ class _ShaderPreProcessor:
         )
         kw, dtype, name, maybe_length = m.groups()
         length = int(maybe_length) if maybe_length else 1
-        return kw, getattr(gl, dtype), name, length
+        gl_dtype = _gl_dtype(dtype)
+        if gl_dtype is None:
+            raise SyntaxError(
+                f"Unsupported type {dtype!r} for {kw} {name!r} on line "
+                f"{self._line_number}. Only builtin glsl types can be used "
+                f"outside of uniform blocks."
+            )
+        return kw, gl_dtype, name, length
+
+
+def _gl_dtype(name):
+    """The numpy dtype for a glsl type name, or None if gamelib doesn't
+    support the type (structs for example)."""
+
+    dtype = getattr(gl, name, None)
+    if isinstance(dtype, np.dtype):
+        return dtype
+    return None
 
 
 class _FunctionPreprocessor:
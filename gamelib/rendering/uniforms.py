@@ -1,5 +1,6 @@
 import numpy as np
 
+import gamelib
 from gamelib.core import gl
 
 
@@ -48,10 +49,132 @@ class AutoUniform:
         self.array = array
         self.dtype = dtype
         self.name = name
+        self._base_dtype = gl.coerce_array(array, dtype).dtype
+        self._scratch = None
 
     def update(self, prog):
         prog[self.name].write(self._data)
 
     @property
     def _data(self):
-        return gl.coerce_array(self.array, self.dtype).tobytes()
+        """The source array as the uniform's datatype. moderngl accepts any
+        buffer, so a matching array is written as is and conversions are
+        copied into a reused scratch array."""
+
+        array = self.array
+        if array.dtype == self._base_dtype and array.flags.c_contiguous:
+            return array
+        if self._scratch is None or self._scratch.shape != array.shape:
+            self._scratch = np.empty(array.shape, self._base_dtype)
+        np.copyto(self._scratch, array, casting="unsafe")
+        return self._scratch
+
+
+class UniformBuffer:
+    """Stages the members of a glsl uniform block in a single std140 laid
+    out array, so the whole block is uploaded with one buffer write rather
+    than one call per uniform."""
+
+    def __init__(self, block, binding):
+        """
+        Parameters
+        ----------
+        block : shaders.GLSLUniformBlock
+        binding : int
+            The uniform buffer binding point to bind to when updated.
+        """
+
+        self.name = block.name
+        self.binding = binding
+        size, layout = _std140_layout(block.uniforms.values())
+        self._staging = np.zeros(size, np.uint8)
+        self._views = {
+            name: np.ndarray(
+                shape, dtype, self._staging, offset=offset, strides=strides
+            )
+            for name, (offset, dtype, shape, strides) in layout.items()
+        }
+        self._dtypes = {
+            name: uniform.dtype for name, uniform in block.uniforms.items()
+        }
+        self._arrays = dict()
+        self._dirty = True
+        self._glo = None
+
+    def source(self, name, source):
+        """Source a member of the block. An np.ndarray is read from every
+        update, python values are written to the staging array just once.
+
+        Parameters
+        ----------
+        name : str
+        source : np.ndarray | Any
+        """
+
+        if isinstance(source, np.ndarray):
+            self._arrays[name] = source
+        else:
+            self._arrays.pop(name, None)
+            self._stage(name, np.array(source, self._dtypes[name]))
+        self._dirty = True
+
+    def update(self):
+        """Writes the staged block to the gpu and binds it."""
+
+        for name, array in self._arrays.items():
+            self._stage(name, array)
+        if self._glo is None:
+            ctx = gamelib.get_context()
+            self._glo = ctx.buffer(reserve=self._staging.size)
+        if self._arrays or self._dirty:
+            self._glo.write(self._staging)
+            self._dirty = False
+        self._glo.bind_to_uniform_block(self.binding)
+
+    def _stage(self, name, array):
+        view = self._views[name]
+        np.copyto(view, np.reshape(array, view.shape), casting="unsafe")
+
+
+def _std140_layout(uniforms):
+    """Computes where each uniform lives within a std140 block.
+
+    Returns
+    -------
+    tuple[int, dict]:
+        The size of the block, and a mapping of uniform name to the
+        (offset, dtype, shape, strides) of a view into the block.
+    """
+
+    offset = 0
+    layout = dict()
+    for uniform in uniforms:
+        base = uniform.dtype.base
+        if base.kind == "b":
+            # glsl bools are 4 bytes wide
+            base = gl.uint
+        shape = uniform.dtype.shape
+        components = shape[0] if shape else 1
+        # matrices are laid out as an array of column vectors
+        columns = shape[1] if len(shape) == 2 else 1
+        elements = columns * uniform.length
+
+        size = base.itemsize * components
+        if elements > 1:
+            # each array element is aligned to a vec4
+            align = stride = _round_up(size, 16)
+            size = stride * elements
+        elif components == 3:
+            align = stride = base.itemsize * 4
+        else:
+            align = stride = size
+        offset = _round_up(offset, align)
+
+        view = (offset, base, (elements, components), (stride, base.itemsize))
+        layout[uniform.name] = view
+        offset += size
+    return _round_up(offset, 16), layout
+
+
+def _round_up(value, multiple):
+    return -(-value // multiple) * multiple
@@ -90,11 +90,13 @@ class MethodMarker:
         self.owner = owner
 
         setattr(owner, name, self.func)
-        existing_injection = getattr(owner, self._INJECTION_ATTRIBUTE, None)
-        if existing_injection:
+        existing_injection = owner.__dict__.get(self._INJECTION_ATTRIBUTE)
+        if existing_injection is not None:
             existing_injection.append(self)
         else:
-            setattr(owner, self._INJECTION_ATTRIBUTE, [self])
+            # copy inherited markers so a subclass never adds to its parent's
+            inherited = getattr(owner, self._INJECTION_ATTRIBUTE, [])
+            setattr(owner, self._INJECTION_ATTRIBUTE, [*inherited, self])
 
     def __eq__(self, other):
         if not isinstance(other, MethodMarker):
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import shutil
 import time
@@ -35,6 +36,8 @@ def tempdir():
 
 
 class RecordedCallback:
+    __slots__ = ("called", "args", "kwargs")
+
     def __init__(self):
         self.called = 0
         self.args = []
@@ -212,8 +215,14 @@ def shaderdir(tempdir):
 def write_shader_to_disk(shaderdir):
     def writer(filename, src):
         fn = filename if filename.endswith(".glsl") else filename + ".glsl"
-        with open(shaderdir / fn, "w") as f:
+        path = shaderdir / fn
+        previous = path.stat().st_mtime_ns if path.exists() else None
+        with open(path, "w") as f:
             f.write(src)
+        if previous is not None and path.stat().st_mtime_ns <= previous:
+            # a rewrite within the filesystem's timestamp resolution keeps
+            # the old mtime, step it forward so the change can be detected
+            os.utime(path, ns=(previous + 1, previous + 1))
         # update resource module after writing new files
         resources.set_content_roots(shaderdir)
 
@@ -0,0 +1,15 @@
+import pytest
+
+import gamelib
+
+
+@pytest.fixture(autouse=True, scope="session")
+def gl_context():
+    # creating a context is expensive, so every test module shares one.
+    # under pytest-xdist (pytest -n 4) each worker process is its own
+    # session, so every worker gets its own context
+    gamelib.init(headless=True)
+    ctx = gamelib.get_context()
+    yield ctx
+    # gamelib.exit() raises SystemExit through the window's close hook
+    ctx.release()
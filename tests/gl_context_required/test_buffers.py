@@ -6,11 +6,6 @@ from gamelib.core import gl
 from gamelib.rendering import buffers
 
 
-@pytest.fixture(autouse=True, scope="module")
-def init_opengl_context():
-    gamelib.init(headless=True)
-
-
 class FakeLock:
     def __init__(self):
         self.times_used = 0
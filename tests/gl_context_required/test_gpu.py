@@ -1,5 +1,4 @@
-import time
-
+import gc
 import numpy as np
 import pytest
 import gamelib
@@ -12,10 +11,62 @@ from gamelib.rendering import shaders
 from ..conftest import assert_approx
 
 
+# shared read only inputs, tests that mutate their input take a copy
+_V_POS9 = np.arange(9, dtype=gl.float)
+_V_POS18_VEC3 = gl.coerce_array(np.arange(18), gl.vec3)
+_COLOR4 = np.array([1.0, 1.0, 1.0, 1.0], gl.float)
+_BUFFER_IN1 = np.arange(6, dtype=gl.int)
+_BUFFER_IN2 = np.arange(6, 12, dtype=gl.int)
+_BUFFER_SUM = _BUFFER_IN1 + _BUFFER_IN2
+for _array in (
+    _V_POS9,
+    _V_POS18_VEC3,
+    _COLOR4,
+    _BUFFER_IN1,
+    _BUFFER_IN2,
+    _BUFFER_SUM,
+):
+    _array.setflags(write=False)
+
+# source -> Shader, so each unique source is only preprocessed once
+_shader_cache = dict()
+# sorted uniform descriptions -> TransformFeedback, see TestUniformBlock
+_uniform_block_instructions = dict()
+
+
+def get_shader(src):
+    shader = _shader_cache.get(src)
+    if shader is None:
+        shader = _shader_cache[src] = shaders.Shader(src=src)
+    return shader
+
+
 @pytest.fixture(autouse=True, scope="module")
-def init_ctx():
-    gamelib.init(headless=True)
-    yield gamelib.get_context()
+def init_ctx(gl_context):
+    yield gl_context
+    _shader_cache.clear()
+    _uniform_block_instructions.clear()
+
+
+@pytest.fixture(scope="module")
+def reusable_vec3_buffer():
+    # shared between tests, which reset its contents before using it
+    return buffers.Buffer(np.zeros(9, gl.float), gl.vec3)
+
+
+@pytest.fixture(scope="module")
+def reusable_vec3_autobuffer():
+    return buffers.AutoBuffer(np.zeros(9, gl.float), gl.vec3)
+
+
+@pytest.fixture(scope="module")
+def camera():
+    return rendering.PerspectiveCamera((123, 123, 123), (1, 3, 2))
+
+
+@pytest.fixture(scope="module")
+def xfb_cache():
+    return dict()
 
 
 class TestVertexArray:
@@ -34,71 +85,73 @@ class TestVertexArray:
         }
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def shader(self):
-        return shaders.Shader(src=self.shader_source)
+        return get_shader(self.shader_source)
 
     def test_init(self, shader):
-        vao = gpu.VertexArray(
-            shader, v_pos=np.arange(9), f_color=np.array([1.0, 1.0, 1.0, 1.0])
-        )
+        vao = gpu.VertexArray(shader, v_pos=_V_POS9, f_color=_COLOR4)
 
         assert vao.glo is not None
 
     def test_same_internal_shader_object(self, shader):
-        vao1 = gpu.VertexArray(
-            shader, v_pos=np.arange(9), f_color=np.array([1.0, 1.0, 1.0, 1.0])
-        )
-        vao2 = gpu.VertexArray(
-            shader, v_pos=np.arange(9), f_color=np.array([1.0, 1.0, 1.0, 1.0])
-        )
+        vao1 = gpu.VertexArray(shader, v_pos=_V_POS9, f_color=_COLOR4)
+        vao2 = gpu.VertexArray(shader, v_pos=_V_POS9, f_color=_COLOR4)
 
         assert vao1.shader is vao2.shader
 
-    def test_sourcing_an_attached_buffer_with_an_array(self, shader):
-        buffer = buffers.Buffer(np.arange(9), gl.vec3)
-        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=np.arange(4))
+    def test_sourcing_an_attached_buffer_with_an_array(
+        self, shader, reusable_vec3_buffer
+    ):
+        buffer = reusable_vec3_buffer
+        buffer.write(_V_POS9)
+        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=_COLOR4)
 
-        array = np.arange(18, dtype=gl.vec3)
+        array = _V_POS18_VEC3
         vao.source_buffers(v_pos=array)
 
-        assert np.all(buffer.read() == array)
+        assert np.array_equal(buffer.read(), array)
 
-    def test_sourcing_an_attached_buffer_with_a_list(self, shader):
-        buffer = buffers.Buffer(np.arange(9), gl.vec3)
-        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=np.arange(4))
+    def test_sourcing_an_attached_buffer_with_a_list(
+        self, shader, reusable_vec3_buffer
+    ):
+        buffer = reusable_vec3_buffer
+        buffer.write(_V_POS9)
+        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=_COLOR4)
 
         list_ = [(1, 2, 3), (3, 2, 1)]
         array = np.array(list_, dtype=gl.vec3)
         vao.source_buffers(v_pos=list_)
 
-        assert np.all(buffer.read() == array)
+        assert np.array_equal(buffer.read(), array)
 
-    def test_sourcing_an_attached_autobuffer_with_an_array(self, shader):
-        buffer = buffers.AutoBuffer(np.array((1, 2, 3)), gl.vec3)
-        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=np.arange(4))
+    def test_sourcing_an_attached_autobuffer_with_an_array(
+        self, shader, reusable_vec3_autobuffer
+    ):
+        buffer = reusable_vec3_autobuffer
+        buffer.use_array(np.array((1, 2, 3)))
+        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=_COLOR4)
 
-        array = gl.coerce_array(np.arange(18), gl.vec3)
+        array = _V_POS18_VEC3.copy()
         vao.source_buffers(v_pos=array)
         array += 100
         buffer.update()
 
-        assert np.all(buffer.read() == array)
+        assert np.array_equal(buffer.read(), array)
 
     def test_updates_autobuffers(self, shader):
-        array = gl.coerce_array(np.arange(18), gl.vec3)
+        array = _V_POS18_VEC3.copy()
         buffer = buffers.AutoBuffer(array, gl.vec3)
-        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=np.arange(4))
+        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=_COLOR4)
 
         array += 100
         vao.update()
 
-        assert np.all(buffer.read() == array)
+        assert np.array_equal(buffer.read(), array)
 
     def test_creates_new_glo_if_buffer_glo_changes(self, shader):
-        array = gl.coerce_array(np.arange(18), gl.vec3)
-        buffer = buffers.Buffer(array, gl.vec3)
-        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=np.arange(4))
+        buffer = buffers.Buffer(_V_POS18_VEC3, gl.vec3)
+        vao = gpu.VertexArray(shader, v_pos=buffer, f_color=_COLOR4)
         identity = id(vao.glo)
 
         buffer.write(np.arange(27))
@@ -108,8 +161,8 @@ class TestVertexArray:
     def test_num_entities_governed_by_smallest_buffer(self):
         array1 = np.arange(12)
         array2 = np.arange(12)
-        shader = shaders.Shader(
-            src="""
+        shader = get_shader(
+            """
             #version 330
             #vert
             in int input1;
@@ -135,8 +188,8 @@ class TestVertexArray:
     def test_num_elements_with_index_buffer(self):
         index_array = np.arange(8)
         input_array = np.arange(10)
-        shader = shaders.Shader(
-            src="""
+        shader = get_shader(
+            """
             #version 330
             #vert
             in int test_in;
@@ -159,8 +212,8 @@ class TestVertexArray:
         assert program.num_elements == 8
 
     def test_num_instances(self):
-        shader = shaders.Shader(
-            src="""
+        shader = get_shader(
+            """
             #version 330
             #vert
             in vec3 v_pos;
@@ -187,6 +240,22 @@ class TestVertexArray:
         assert vao.num_instances == 5
         assert vao.num_elements == 3
 
+    def test_num_elements_follows_resourced_buffers(self, shader):
+        vao = gpu.VertexArray(
+            shader, auto=False, v_pos=_V_POS9, f_color=_COLOR4
+        )
+        assert vao.num_elements == 3
+
+        vao.use_source("v_pos", _V_POS18_VEC3)
+        assert vao.num_elements == 6
+
+        external = buffers.Buffer(np.arange(3), gl.vec3)
+        vao.use_source("v_pos", external)
+        assert vao.num_elements == 1
+
+        external.write(np.arange(12, dtype=gl.float))
+        assert vao.num_elements == 4
+
 
 class TestTransformFeedback:
     def test_base_case(self):
@@ -224,39 +293,104 @@ class TestTransformFeedback:
         assert_approx(data_in * 2, transformed["data_out1"])
         assert_approx(data_in * 3, transformed["data_out2"])
 
+    def test_repeated_transforms_reuse_the_vertex_array(self):
+        instructions = gpu.TransformFeedback(
+            shader="""
+                #version 330
+                #vert
+                in float data_in;
+                out float data_out;
+                void main() {
+                    data_out = 2 * data_in;
+                }
+            """
+        )
+        data_in = np.arange(10, dtype=gl.float)
+        instructions.transform(data_in=data_in)
+        glo = instructions.vao.glo
+
+        data_in += 5
+        assert_approx(data_in * 2, instructions.transform(data_in=data_in))
+        assert instructions.vao.glo is glo
+
+        fewer = np.arange(4, dtype=gl.float)
+        assert_approx(fewer * 2, instructions.transform(data_in=fewer))
+
+    def test_dropped_programs_leave_the_program_cache(self):
+        cached_before = set(shaders._program_cache.keys())
+        instructions = gpu.TransformFeedback(
+            shader="""
+                #version 330
+                #vert
+                in float data_in;
+                out float data_out;
+                void main() {
+                    data_out = 7 * data_in;
+                }
+            """
+        )
+        instructions.transform(data_in=np.arange(4, dtype=gl.float))
+        added = set(shaders._program_cache.keys()) - cached_before
+        assert added
+
+        del instructions
+        gc.collect()
+        assert not added & set(shaders._program_cache.keys())
+
+
+def cached_transform_feedback(cache, src, test_input):
+    """Builds a TransformFeedback once per source and uniform shape, later
+    requests just source the new uniform."""
+
+    key = (src, test_input.shape)
+    instructions = cache.get(key)
+    if instructions is None:
+        instructions = gpu.TransformFeedback(src, test_input=test_input)
+        cache[key] = instructions
+    else:
+        instructions.source(test_input=test_input)
+    return instructions
+
+
+def same_data(a, b):
+    """Equivalent to a.tobytes() == b.tobytes(), without copying the arrays
+    into bytes objects when their dtypes match."""
+
+    if a.dtype != b.dtype:
+        return a.tobytes() == b.tobytes()
+    return np.array_equal(a.reshape(-1), b.reshape(-1))
+
 
 class TestVaoIntegration:
     """Use TransformFeedback to send live data to the gpu for testing."""
 
-    def test_automatic_uniform_sourcing(self, glsl_dtype_and_input):
+    def test_automatic_uniform_sourcing(self, glsl_dtype_and_input, xfb_cache):
         gl_type, input_value = glsl_dtype_and_input
         if gl_type == "sampler2D" or gl_type.startswith("b"):
             # not applicable
             return
 
         uniform = np.array(input_value)
-        instructions = gpu.TransformFeedback(
-            shader=f"""
-                #version 400
-                #vert
-                uniform {gl_type} test_input;
-                out {gl_type} test_output;
-                void main()
-                {{
-                    test_output = test_input;
-                }}
-            """,
-            test_input=uniform,
-        )
+        src = f"""
+            #version 400
+            #vert
+            uniform {gl_type} test_input;
+            out {gl_type} test_output;
+            void main()
+            {{
+                test_output = test_input;
+            }}
+        """
+        instructions = cached_transform_feedback(xfb_cache, src, uniform)
 
         expected = gl.coerce_array(uniform, gl_type)
-        assert instructions.transform(1).tobytes() == expected.tobytes()
+        assert same_data(instructions.transform(1), expected)
 
         uniform += 1
         expected = gl.coerce_array(uniform, gl_type)
-        assert instructions.transform(1).tobytes() == expected.tobytes()
+        assert same_data(instructions.transform(1), expected)
 
-    def test_uniform_array_support(self, glsl_dtype_and_input):
+    def test_uniform_array_support(self, glsl_dtype_and_input, xfb_cache):
         gl_type, input_value = glsl_dtype_and_input
         if gl_type == "sampler2D" or gl_type.startswith("b"):
             # not applicable
@@ -265,24 +399,20 @@ class TestVaoIntegration:
         arr1 = np.array(input_value)
         arr2 = arr1 + 7
         uniform = np.stack((arr1, arr2))
-        instructions = gpu.TransformFeedback(
-            shader=f"""
-                #version 400
-                #vert
-                uniform {gl_type} test_input[2];
-                out {gl_type} test_output;
-                void main()
-                {{
-                    test_output = test_input[gl_VertexID];
-                }}
-            """,
-            test_input=uniform,
-        )
+        src = f"""
+            #version 400
+            #vert
+            uniform {gl_type} test_input[2];
+            out {gl_type} test_output;
+            void main()
+            {{
+                test_output = test_input[gl_VertexID];
+            }}
+        """
+        instructions = cached_transform_feedback(xfb_cache, src, uniform)
 
         expected = gl.coerce_array(uniform, gl_type)
-        assert (
-            instructions.transform(vertices=2).tobytes() == expected.tobytes()
-        )
+        assert same_data(instructions.transform(vertices=2), expected)
 
     def test_use_uniforms_no_current_uniforms(self):
         instructions = gpu.TransformFeedback(
@@ -306,6 +436,28 @@ class TestVaoIntegration:
         uni2 += 11
         assert instructions.transform(1) == uni1 + uni2
 
+    def test_constant_uniforms_with_a_shared_program(self):
+        src = """
+            #version 330
+            #vert
+            uniform int constant;
+            out int output_value;
+            void main()
+            {
+                output_value = constant;
+            }
+        """
+        instructions1 = gpu.TransformFeedback(src, constant=1)
+        instructions2 = gpu.TransformFeedback(src, constant=2)
+        assert instructions1.shader.glo is instructions2.shader.glo
+
+        for _ in range(2):
+            assert instructions1.transform(1) == 1
+            assert instructions2.transform(1) == 2
+
+        instructions1.source(constant=3)
+        assert instructions1.transform(1) == 3
+
     def test_use_uniforms_with_existing_uniforms_in_place(self):
         uni1, uni2 = np.array([0], gl.int), np.array([100], gl.int)
         instructions = gpu.TransformFeedback(
@@ -347,19 +499,17 @@ class TestVaoIntegration:
             }
             """
         )
-        array1 = np.arange(6, dtype=gl.int)
-        array2 = np.arange(6, 12, dtype=gl.int)
+        array1 = _BUFFER_IN1.copy()
+        array2 = _BUFFER_IN2.copy()
 
         instructions.source(input1=array1, input2=array2)
-        assert np.all(instructions.transform() == array1 + array2)
+        assert np.array_equal(instructions.transform(), _BUFFER_SUM)
 
         array1 += 10
         array2 += 20
-        assert np.all(instructions.transform() == array1 + array2)
+        assert np.array_equal(instructions.transform(), _BUFFER_SUM + 30)
 
     def test_use_buffer_buffers_already_there(self):
-        array1 = np.arange(6, dtype=gl.int)
-        array2 = np.arange(6, 12, dtype=gl.int)
         instructions = gpu.TransformFeedback(
             shader="""
                 #version 330
@@ -372,20 +522,20 @@ class TestVaoIntegration:
                     output_value = input1 + input2;
                 }
             """,
-            input1=array1,
-            input2=array2,
+            input1=_BUFFER_IN1,
+            input2=_BUFFER_IN2,
         )
-        assert np.all(instructions.transform() == array1 + array2)
+        assert np.array_equal(instructions.transform(), _BUFFER_SUM)
 
         array3 = np.arange(100, dtype=gl.int)
         array4 = np.arange(100, dtype=gl.int)
         instructions.source(input1=array3, input2=array4)
 
-        assert np.all(instructions.transform() == array3 + array4)
+        assert np.array_equal(instructions.transform(), array3 + array4)
 
         array3 += 100
         array4 += 33
-        assert np.all(instructions.transform() == array3 + array4)
+        assert np.array_equal(instructions.transform(), array3 + array4)
 
     def test_using_a_callable_as_a_source(self):
         array1 = np.arange(6, dtype=gl.int)
@@ -403,11 +553,11 @@ class TestVaoIntegration:
             """,
             input1=proxy,
         )
-        assert np.all(instructions.transform() == array1)
+        assert np.array_equal(instructions.transform(), array1)
 
         array1 = np.arange(12)
 
-        assert np.all(instructions.transform() == array1)
+        assert np.array_equal(instructions.transform(), array1)
 
     def test_using_a_list_as_a_source(self):
         list1 = [(100, 10, 1), (100, 20, 3)]
@@ -426,11 +576,11 @@ class TestVaoIntegration:
             """,
             in_value=list1,
         )
-        assert np.all(instructions.transform() == [111, 123])
+        assert np.array_equal(instructions.transform(), [111, 123])
 
         instructions.source(in_value=list2)
 
-        assert np.all(instructions.transform() == [111, 123, 111, 123])
+        assert np.array_equal(instructions.transform(), [111, 123, 111, 123])
 
     def test_automatic_hot_reloading_shaders_when_the_new_shader_is_valid(
         self, write_shader_to_disk
@@ -452,7 +602,6 @@ class TestVaoIntegration:
 
         assert instructions.transform(1) == 123
 
-        time.sleep(0.01)
         write_shader_to_disk("test", src % 321)
         assert instructions.transform(1) == 321
 
@@ -476,7 +625,6 @@ class TestVaoIntegration:
 
         assert instructions.transform(1) == 123
 
-        time.sleep(0.01)
         write_shader_to_disk("test", src % "invalid")
         assert instructions.transform(1) == 123
 
@@ -484,21 +632,30 @@ class TestVaoIntegration:
 class TestUniformBlock:
     @staticmethod
     def make_instructions(**uniform_descs):
-        uni_declarations = "\n".join(
-            f"uniform {type} {name};" for name, type in uniform_descs.items()
-        )
+        """The uniforms are declared in a single glsl uniform block, so they
+        are uploaded together as one buffer."""
+
+        descs = tuple(sorted(uniform_descs.items()))
+        instructions = _uniform_block_instructions.get(descs)
+        if instructions is not None:
+            instructions.vao.check_global_uniforms()
+            return instructions
+
+        uni_declarations = "\n".join(f"{type} {name};" for name, type in descs)
         out_declarations = "\n".join(
-            f"out {type} {'out_' + name};"
-            for name, type in uniform_descs.items()
+            f"out {type} {'out_' + name};" for name, type in descs
         )
         out_assignments = "\n".join(
-            f"out_{name} = {name};" for name in uniform_descs
+            f"out_{name} = {name};" for name, _ in descs
         )
-        return gpu.TransformFeedback(
+        instructions = gpu.TransformFeedback(
             f"""
         #version 330
         #vert
-        {uni_declarations}
+        uniform Block
+        {{
+            {uni_declarations}
+        }};
         {out_declarations}
 
         void main()
@@ -507,6 +664,8 @@ class TestUniformBlock:
         }}
         """
         )
+        _uniform_block_instructions[descs] = instructions
+        return instructions
 
     def test_sourcing_instructions(self):
         class MyBlock(rendering.uniforms.UniformBlock):
@@ -541,23 +700,21 @@ class TestUniformBlock:
         gamelib.get_cursor = lambda: (12, 34)
         gamelib.get_width = lambda: 100
         gamelib.get_height = lambda: 100
-        gamelib.update()
+        rendering.refresh_global_uniforms()
         inst = self.make_instructions(cursor="vec2")
 
         assert np.allclose(inst.transform(1), (12 / 100, 34 / 100))
 
-    def test_view_mat4(self):
-        camera = rendering.PerspectiveCamera((123, 123, 123), (1, 3, 2))
+    def test_view_mat4(self, camera):
         camera.set_primary()
-        gamelib.update()
+        rendering.refresh_global_uniforms()
         inst = self.make_instructions(view="mat4")
 
         assert np.allclose(inst.transform(1), camera.view_matrix)
 
-    def test_proj_mat4(self):
-        camera = rendering.PerspectiveCamera((123, 123, 123), (1, 3, 2))
+    def test_proj_mat4(self, camera):
         camera.set_primary()
-        gamelib.update()
+        rendering.refresh_global_uniforms()
         inst = self.make_instructions(proj="mat4")
 
         assert np.allclose(inst.transform(1), camera.proj_matrix)
@@ -565,7 +722,87 @@ class TestUniformBlock:
     def test_window_size(self):
         gamelib.get_width = lambda: 16
         gamelib.get_height = lambda: 9
-        gamelib.update()
+        rendering.refresh_global_uniforms()
         inst = self.make_instructions(window_size="ivec2")
 
         assert np.allclose(inst.transform(1), [16, 9])
+
+
+class TestGLSLUniformBlock:
+    src = """
+        #version 330
+        #vert
+        uniform Block
+        {
+            float scale;
+            vec3 offset;
+            mat3 rotation;
+            vec2 points[2];
+        };
+        out vec3 out_offset;
+        out vec3 out_rotated;
+        out float out_sum;
+
+        void main()
+        {
+            out_offset = offset * scale;
+            out_rotated = rotation * vec3(1, 2, 3);
+            out_sum = points[0].x + points[0].y + points[1].x + points[1].y;
+        }
+    """
+
+    def test_sourcing_block_members(self):
+        rotation = np.arange(9, dtype=gl.float).reshape(3, 3)
+        inst = gpu.TransformFeedback(
+            self.src,
+            scale=2,
+            offset=(1, 2, 3),
+            rotation=rotation,
+            points=np.array([(1, 2), (3, 4)], gl.float),
+        )
+
+        result = inst.transform(1)
+
+        assert_approx(result["out_offset"][0], (2, 4, 6))
+        # glsl matrices are column major
+        assert_approx(result["out_rotated"][0], rotation.T.dot((1, 2, 3)))
+        assert result["out_sum"][0] == 10
+
+    def test_array_sources_are_reread(self):
+        scale = np.array([1.0], gl.float)
+        inst = gpu.TransformFeedback(
+            self.src,
+            scale=scale,
+            offset=(1, 2, 3),
+            rotation=np.identity(3),
+            points=np.zeros((2, 2)),
+        )
+        inst.transform(1)
+
+        scale[0] = 3
+        result = inst.transform(1)
+
+        assert_approx(result["out_offset"][0], (3, 6, 9))
+
+    def test_global_uniforms_in_a_block(self, camera):
+        camera.set_primary()
+        rendering.refresh_global_uniforms()
+        inst = gpu.TransformFeedback(
+            """
+            #version 330
+            #vert
+            uniform Camera
+            {
+                mat4 view;
+                mat4 proj;
+            };
+            out mat4 out_view;
+
+            void main()
+            {
+                out_view = view;
+            }
+            """
+        )
+
+        assert np.allclose(inst.transform(1), camera.view_matrix)
@@ -1,7 +1,6 @@
+import gc
 import pytest
 
-import time
-
 from gamelib.rendering import shaders
 from gamelib.core import gl
 
@@ -28,14 +27,55 @@ def test_hot_reloading_when_modification_is_valid(write_shader_to_disk):
     shader = shaders.Shader("test")
     glo = shader.glo
 
-    time.sleep(0.01)
-    write_shader_to_disk("test", MINIMAL_SRC)
+    write_shader_to_disk("test", MINIMAL_SRC + "const int x = 1;")
 
     assert shader.try_hot_reload() is True
     assert shader.glo is not glo
     assert shader.has_been_modified is False
 
 
+def test_hot_reloading_releases_the_previous_program(write_shader_to_disk):
+    # a source no other test uses, so nothing else holds on to its program
+    write_shader_to_disk("test", MINIMAL_SRC + "const int y = 2;")
+    shader = shaders.Shader("test")
+    glo = shader.glo
+    key = shader._program_key(shader.code, shader.meta)
+
+    write_shader_to_disk("test", MINIMAL_SRC + "const int x = 1;")
+    shader.try_hot_reload()
+
+    assert glo is not shader.glo
+    del glo
+    gc.collect()
+    assert key not in shaders._program_cache
+
+
+def test_hot_reloading_keeps_programs_other_shaders_use(write_shader_to_disk):
+    write_shader_to_disk("test", MINIMAL_SRC)
+    shader = shaders.Shader("test")
+    other = shaders.Shader(src=MINIMAL_SRC)
+    assert shader.glo is other.glo
+
+    write_shader_to_disk("test", MINIMAL_SRC + "const int x = 1;")
+    shader.try_hot_reload()
+
+    assert shaders.Shader(src=MINIMAL_SRC).glo is other.glo
+
+
+def test_hot_reloading_when_source_is_rewritten_unchanged(
+    write_shader_to_disk,
+):
+    write_shader_to_disk("test", MINIMAL_SRC)
+    shader = shaders.Shader("test")
+    glo = shader.glo
+
+    write_shader_to_disk("test", MINIMAL_SRC)
+
+    assert shader.try_hot_reload() is False
+    assert shader.glo is glo
+    assert shader.has_been_modified is False
+
+
 def test_hot_reloading_when_modification_is_invalid(
     write_shader_to_disk, capsys
 ):
@@ -43,7 +83,6 @@ def test_hot_reloading_when_modification_is_invalid(
     shader = shaders.Shader("test")
     glo = shader.glo
 
-    time.sleep(0.01)
     write_shader_to_disk("test", MINIMAL_SRC + "not code")
 
     assert shader.try_hot_reload() is False
@@ -52,6 +91,42 @@ def test_hot_reloading_when_modification_is_invalid(
     assert shader.has_been_modified is False
 
 
+def test_hot_reloading_doesnt_recompile_the_same_invalid_modification(
+    write_shader_to_disk, capsys
+):
+    write_shader_to_disk("test", MINIMAL_SRC)
+    shader = shaders.Shader("test")
+    shader.glo
+    write_shader_to_disk("test", MINIMAL_SRC + "not code")
+    shader.try_hot_reload()
+    capsys.readouterr()
+
+    write_shader_to_disk("test", MINIMAL_SRC + "not code")
+
+    assert shader.try_hot_reload() is False
+    # no compiler error is reported the second time around
+    assert not capsys.readouterr().out
+    assert shader.has_been_modified is False
+
+
+def test_hot_reloading_reports_a_repeated_invalid_modification_again(
+    write_shader_to_disk, capsys
+):
+    write_shader_to_disk("test", MINIMAL_SRC)
+    shader = shaders.Shader("test")
+    shader.glo
+    write_shader_to_disk("test", MINIMAL_SRC + "not code")
+    shader.try_hot_reload()
+    write_shader_to_disk("test", MINIMAL_SRC + "const int x = 1;")
+    assert shader.try_hot_reload() is True
+    capsys.readouterr()
+
+    write_shader_to_disk("test", MINIMAL_SRC + "not code")
+
+    assert shader.try_hot_reload() is False
+    assert capsys.readouterr().out
+
+
 def test_line_number_on_error_base_case(write_shader_to_disk):
     src = """#version 330
     #vert
@@ -168,3 +243,11 @@ def test_error_line_number_after_vertex_stage(
     assert "line 7" in error_message
     assert "error on line number 7" in error_message
     assert "test.glsl" in error_message
+
+
+def test_identical_sources_share_a_program():
+    shader1 = shaders.Shader(src=MINIMAL_SRC)
+    shader2 = shaders.Shader(src=MINIMAL_SRC)
+
+    assert shader1 is not shader2
+    assert shader1.glo is shader2.glo
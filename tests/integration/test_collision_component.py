@@ -5,6 +5,20 @@ from gamelib import ecs
 from gamelib import geometry
 
 
+def _grid_bvh(z):
+    model = geometry.GridMesh(4, 4)
+    model.vertices += gamelib.Vec3(0, 0, z)
+    # create_tree caches by model identity and boundaries, so the
+    # boundaries must be current for these throwaway models
+    model.recalculate_boundaries()
+    return geometry.BVH.create_tree(model)
+
+
+# ray queries don't modify a bvh, so the trees are built once and shared
+_GRID_BVH = _grid_bvh(0)
+_RAISED_GRID_BVH = _grid_bvh(1)
+
+
 @pytest.fixture(autouse=True)
 def cleanup():
     ecs.Entity.clear()
@@ -24,11 +38,8 @@ class Entity3(ecs.Entity):
 
 
 def test_first_entity_hit_base_case():
-    model1 = geometry.GridMesh(4, 4)
-    model2 = geometry.GridMesh(4, 4)
-    model2.vertices += gamelib.Vec3(0, 0, 1)
-    entity1 = Entity1.create(ecs.Hitbox.create(model1))
-    entity2 = Entity2.create(ecs.Hitbox.create(model2))
+    entity1 = Entity1.create(ecs.Hitbox.create(_GRID_BVH))
+    entity2 = Entity2.create(ecs.Hitbox.create(_RAISED_GRID_BVH))
 
     ray_top = geometry.Ray((2, 2, 10), (0, 0, -1))
     ray_bottom = geometry.Ray((2, 2, -10), (0, 0, 1))
@@ -40,12 +51,9 @@ def test_first_entity_hit_base_case():
 
 
 def test_first_entity_hit_with_transform():
-    model1 = geometry.GridMesh(4, 4)
-    model1.vertices += gamelib.Vec3(0, 0, 1)
-    model3 = geometry.GridMesh(4, 4)
     transform = ecs.Transform.create(position=(0, 0, 3), theta=30)
-    entity1 = Entity1.create(ecs.Hitbox.create(model1))
-    entity3 = Entity3.create(ecs.Hitbox.create(model3), transform)
+    entity1 = Entity1.create(ecs.Hitbox.create(_RAISED_GRID_BVH))
+    entity3 = Entity3.create(ecs.Hitbox.create(_GRID_BVH), transform)
 
     ray_top = geometry.Ray((2, 2, 10), (0, 0, -1))
     ray_bottom = geometry.Ray((2, 2, -10), (0, 0, 1))
@@ -42,6 +42,12 @@ class TestVectors:
         assert -Vec3(1, 1, 1) == Vec3(-1, -1, -1)
         assert -Vec3(-4, -2, 3) == Vec3(4, 2, -3)
 
+    @pytest.mark.parametrize(
+        "scalar", (1.0, np.float32(1), np.array(1.0), np.array(1, int))
+    )
+    def test_single_scalar_arg(self, scalar):
+        assert Vec3(scalar) == Vec3(1.0)
+
     def test_getitem(self):
         assert Vec3(1, 2, 3)[0] == 1
         assert Vec3(1, 2, 3)[1] == 2
@@ -103,6 +103,21 @@ class TestIdGenerator:
         assert next(gen) == 3
         assert next(gen) == 4
 
+    def test_recycling_many_ids_at_once(self):
+        gen = base.IdGenerator()
+        for _ in range(6):
+            next(gen)
+
+        gen.recycle(2)
+        gen.recycle_many([5, 0, 4, 2])
+
+        assert gen.largest_active == 3
+        assert next(gen) == 0
+        assert next(gen) == 2
+        assert next(gen) == 4
+        assert next(gen) == 5
+        assert next(gen) == 6
+
 
 class Component1(base.Component):
     x: float
@@ -194,6 +209,19 @@ class TestComponent:
         assert Component1.get(component3.id) == component3
         assert len(Component1) == 2
 
+    def test_existing_instance_follows_its_data_when_swapped(self):
+        component1 = Component1.create(1, 1)
+        component2 = Component1.create(2, 2)
+        assert component2.values == (2, 2)
+
+        # component2 data gets swapped into the slot component1 vacated
+        Component1.destroy(component1.id)
+        assert component2.values == (2, 2)
+
+        component2.x = 3
+        assert Component1.get(component2.id) == (3, 2)
+        assert component1.values == (None, None)
+
     def test_mutating_data_by_an_instance(self):
         component = Component1.create(1, 2)
         assert Component1.get(component.id) == (1, 2)
@@ -215,6 +243,13 @@ class TestComponent:
     def test_internal_length(self):
         assert Component1.internal_length == len(Component1.view_raw_arrays())
 
+    def test_raw_arrays_are_a_view_of_the_component_data(self):
+        component = Component1.create(1, 2)
+        raw = Component1.view_raw_arrays()
+
+        component.x = 100
+        assert raw[component.id]["x"] == 100
+
     def test_automatic_growth(self):
         starting_length = Component1.internal_length
         for _ in range(starting_length + 1):
@@ -386,6 +421,12 @@ class TestEntity:
         assert entity.comp1 == Component1.get(c1_id)
         assert entity.comp2 == Component2.get(c2_id)
 
+    def test_unknown_keyword_on_construction(self):
+        with pytest.raises(TypeError, match="'comp3'"):
+            Entity1.create(
+                comp1=Component1.create(1, 2), comp3=Component2.create(3, 4)
+            )
+
     def test_equality_comparison(self):
         entity1 = Entity1.create(
             comp1=Component1.create(1, 2), comp2=Component2.create(3, 4)
@@ -595,6 +636,18 @@ class TestEntity:
             assert len(Component1) == 0
             assert len(Component2) == 0
 
+    def test_clearing_a_subclass_leaves_unbound_components(self):
+        loose = Component1.create(5, 5)
+        for i in range(3):
+            Entity1.create(Component1.create(i, i), Component2.create(i, i))
+
+        Entity1.clear()
+
+        assert len(base.Entity) == 0
+        assert len(Component1) == 1
+        assert len(Component2) == 0
+        assert Component1.get(loose.id) == loose
+
     def test_entity_inheritance(self):
         class E(Entity1):
             pass
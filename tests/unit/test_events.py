@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import gc
 import pytest
 import time
+import weakref
 import dataclasses
 from typing import NamedTuple
 from multiprocessing.connection import Pipe
@@ -75,6 +77,25 @@ class TestEventHandling:
 
         assert not recorded_callback.called
 
+    def test_publishing_many_events_in_order(self):
+        published = []
+        events.subscribe(Event, published.append)
+        events.subscribe(DataEvent, published.append)
+        batch = [Event("1"), Event("2"), DataEvent("3"), Event("4")]
+
+        events.publish_many(batch)
+
+        assert published == batch
+
+    def test_unsubscribing_while_publishing(self, recorded_callback):
+        def unsubscribe_self(event):
+            events.unsubscribe(Event, unsubscribe_self)
+
+        events.subscribe(Event, unsubscribe_self, recorded_callback)
+        events.publish(Event())
+
+        assert recorded_callback.called
+
     def test_clearing_a_type_of_event(self):
         cb1, cb2, cb3 = [RecordedCallback() for _ in range(3)]
         events.subscribe(Event, cb1)
@@ -132,6 +153,24 @@ class TestEventHandling:
 
         assert not b.poll(0.001)
 
+    def test_wakeup_pipe_is_only_made_when_polling(self):
+        a, b = Pipe()
+
+        events.service_connection(a, Event, poll=False)
+
+        assert events._adapters[a]._wakeup_send is None
+
+    def test_wakeup_pipe_is_closed_after_service_stops(self):
+        a, b = Pipe()
+        events.service_connection(a, Event)
+        adapter = events._adapters[a]
+
+        events.stop_connection_service(a)
+        adapter.thread.join(1)
+
+        assert adapter._wakeup_recv.closed
+        assert adapter._wakeup_send.closed
+
 
 class HandlerContainer:
     def __init__(self):
@@ -209,3 +248,32 @@ class TestHandlerDecorator:
         container.event_handler(Event())
 
         assert container.record[Event] == 1
+
+    def test_subclass_handlers_are_not_added_to_the_parent(self):
+        class Extended(HandlerContainer):
+            @events.handler(Event)
+            def another_event_handler(self, event):
+                self._record_event(event)
+
+        parent = HandlerContainer()
+        child = Extended()
+        events.subscribe_marked(parent)
+        events.subscribe_marked(child)
+
+        events.publish(Event())
+
+        assert parent.record[Event] == 1
+        assert child.record[Event] == 2
+
+    def test_marked_handler_lookups_dont_keep_classes_alive(self):
+        class Extended(HandlerContainer):
+            @events.handler(Event)
+            def another_event_handler(self, event):
+                self._record_event(event)
+
+        assert events.find_marked_handlers(Extended())[Event]
+        ref = weakref.ref(Extended)
+        del Extended
+        gc.collect()
+
+        assert ref() is None
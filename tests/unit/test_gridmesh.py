@@ -1,3 +1,4 @@
+from gamelib.core import gl
 from gamelib.geometry import GridMesh
 
 
@@ -10,3 +11,10 @@ def test_grid_mesh():
 
     assert mesh2.vertices.size == 9 * 3
     assert mesh2.indices.size == 24
+
+
+def test_grid_mesh_is_built_with_gpu_dtypes():
+    mesh = GridMesh(lod=3, scale=10)
+
+    assert mesh.vertices.dtype == gl.float
+    assert mesh.indices.dtype == gl.uint
@@ -105,6 +105,13 @@ class TestKeyEvent:
         schema(event)
         assert [cb.called for cb in callbacks] == [1, 0, 0]
 
+    def test_callback_without_event_parameter(self):
+        calls = []
+        schema = InputSchema(("a", lambda: calls.append(1)))
+
+        schema(KeyDown(Keyboard.A, Modifiers()))
+        assert calls == [1]
+
     @pytest.mark.parametrize(
         "event, expected_index",
         (
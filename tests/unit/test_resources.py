@@ -141,3 +141,34 @@ def test_get_model_file(tmpdir_maker):
     resources.set_content_roots(root)
 
     assert root / "cube.obj" == resources.get_model_file("cube")
+
+
+def test_adding_a_supported_extension_searches_nested_directories(
+    tmpdir_maker,
+):
+    root = tmpdir_maker("subdir/file.nested_type", "subdir/image.png")
+    resources.set_content_roots(root)
+    resources.add_supported_extensions(".nested_type")
+
+    assert resources.get_file("file.nested_type").parent.name == "subdir"
+    assert len(resources._resource_cache["image.png"]) == 1
+
+
+def test_get_image_file_with_extension_given(tmpdir_maker):
+    root = tmpdir_maker("test_file.png", "test_file.jpg")
+    resources.set_content_roots(root)
+
+    assert root / "test_file.jpg" == resources.get_image_file("test_file.jpg")
+    with pytest.raises(KeyError):
+        resources.get_image_file("missing.png")
+
+
+def test_lookups_are_refreshed_when_roots_change(tmpdir_maker):
+    fs1 = tmpdir_maker("assets1/file.png")
+    fs2 = tmpdir_maker("assets2/file.png")
+
+    resources.set_content_roots(fs1)
+    assert resources.get_image_file("file").parent.name == "assets1"
+
+    resources.set_content_roots(fs2)
+    assert resources.get_image_file("file").parent.name == "assets2"
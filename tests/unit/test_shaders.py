@@ -123,6 +123,73 @@ void main() {}
     assert len(shader.meta.uniforms) == 3
 
 
+def test_parsing_uniform_blocks():
+    src = """
+#version 330
+uniform Camera
+{
+    mat4 view;
+    vec3 lights[4];
+} camera;
+
+#vert
+layout(std140) uniform Time { float t; };
+void main() {}
+"""
+
+    shader = Shader(src=src)
+    camera = shader.meta.uniform_blocks["Camera"]
+    time = shader.meta.uniform_blocks["Time"]
+
+    assert camera.uniforms["view"] == shaders.GLSLUniform("view", gl.mat4, 1)
+    assert camera.uniforms["lights"] == shaders.GLSLUniform(
+        "lights", gl.vec3, 4
+    )
+    assert time.uniforms["t"] == shaders.GLSLUniform("t", gl.float, 1)
+    assert len(shader.meta.uniforms) == 0
+    assert "layout(std140) uniform Camera" in shader.code.vert
+    assert shader.code.vert.count("std140") == 2
+
+
+def test_uniform_blocks_with_struct_members_are_left_as_written():
+    src = """
+#version 330
+struct Light { vec3 position; float strength; };
+uniform Lights
+{
+    Light lights[4];
+    float ambient;
+};
+
+#vert
+void main() {}
+"""
+
+    shader = Shader(src=src)
+
+    assert "Lights" not in shader.meta.uniform_blocks
+    assert len(shader.meta.uniforms) == 0
+    assert "std140" not in shader.code.vert
+    assert "uniform Lights" in shader.code.vert
+
+
+def test_error_for_uniform_with_unsupported_type():
+    src = """
+#version 330
+struct Light { vec3 position; float strength; };
+uniform Light light;
+
+#vert
+void main() {}
+"""
+
+    with pytest.raises(SyntaxError) as excinfo:
+        Shader(src=src)
+
+    assert "Light" in str(excinfo.value)
+    assert "line 3" in str(excinfo.value)
+
+
 def test_error_when_no_source_is_given():
     with pytest.raises(ValueError) as excinfo:
         shader = Shader()
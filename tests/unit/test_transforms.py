@@ -71,3 +71,22 @@ def test_transform(transform, expected):
     blank_transform.apply(vertex)
 
     assert_approx(expected, vertex)
+
+
+@pytest.mark.parametrize(
+    "make_matrix",
+    (
+        lambda **kw: Mat4.rotate_about_x(30, **kw),
+        lambda **kw: Mat4.rotate_about_y(30, **kw),
+        lambda **kw: Mat4.rotate_about_z(30, **kw),
+        lambda **kw: Mat4.rotate_about_axis((1, 2, 3), 30, **kw),
+        lambda **kw: Mat4.model_transform((1, 2, 3), (2, 2, 2), **kw),
+    ),
+)
+def test_mat4_written_into_out(make_matrix):
+    out = np.full((4, 4), 7, "f4")
+
+    result = make_matrix(out=out)
+
+    assert result is out
+    assert_approx(out, make_matrix())